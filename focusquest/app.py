@@ -21,7 +21,7 @@ from .ui.collection_panel import CollectionPanel
 from .ui.xp_toast import XPToast
 from .ui.unlock_popup import UnlockPopup
 from .ui.background_effects import BackgroundEffect
-from .ui.styles import build_stylesheet, get_palette, get_ring_colors
+from .ui.styles import apply_global_stylesheet, get_palette, get_ring_colors
 from .ui.session_history import SessionHistoryWidget
 from .ui.gentle_start import GentleStartWidget
 from .database.db import get_session
@@ -152,7 +152,7 @@ class FocusQuestApp(QMainWindow):
         self._current_theme_key = theme_key
         self._palette = get_palette(theme_key)
         self._ring_colors = get_ring_colors(theme_key)
-        self.setStyleSheet(build_stylesheet(self._palette))
+        apply_global_stylesheet(self._palette)
 
         # ── central widget ────────────────────────────────────────────
         central = QWidget()
@@ -775,8 +775,8 @@ class FocusQuestApp(QMainWindow):
         self._palette = get_palette(theme_key)
         self._ring_colors = get_ring_colors(theme_key)
 
-        # Global stylesheet
-        self.setStyleSheet(build_stylesheet(self._palette))
+        # Global stylesheet (installed once on the QApplication)
+        apply_global_stylesheet(self._palette)
 
         # Per-widget palette updates
         self._timer_widget.apply_palette(self._palette, self._ring_colors)
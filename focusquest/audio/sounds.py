@@ -79,14 +79,16 @@ def _make_envelope(
 def _sine(freq: float, duration_s: float) -> np.ndarray:
     """Pure sine wave at *freq* Hz for *duration_s* seconds."""
     t = np.linspace(0, duration_s, int(SAMPLE_RATE * duration_s), endpoint=False)
-    return np.sin(2 * np.pi * freq * t)
+    t *= 2 * np.pi * freq
+    return np.sin(t, out=t)
 
 
 def _to_wav_bytes(samples: np.ndarray) -> bytes:
     """Convert a float64 numpy array (-1..1) to 16-bit PCM WAV bytes."""
-    # Clip and scale
-    samples = np.clip(samples, -1.0, 1.0)
-    int_samples = (samples * 32767).astype(np.int16)
+    # Clip and scale (in place on the clipped copy)
+    scaled = np.clip(samples, -1.0, 1.0)
+    scaled *= 32767
+    int_samples = scaled.astype(np.int16)
 
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wf:
@@ -5,8 +5,9 @@ from contextlib import contextmanager
 
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session as OrmSession
+from sqlalchemy.pool import StaticPool
 
-from .models import Base, UserProgress
+from .models import Base, UserProgress, USER_PROGRESS_ID
 
 # ── paths ────────────────────────────────────────────────────────────────────
 
@@ -38,89 +39,100 @@ def _get_session_factory():
     return _SessionFactory
 
 
+def _is_memory_url(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:")
+
+
 # ── public API ────────────────────────────────────────────────────────────
 
 
 def configure_engine(url: str) -> None:
     """Override the database connection URL.  Used by tests to point at
-    an in-memory SQLite database instead of the real one on disk."""
+    an in-memory SQLite database instead of the real one on disk.
+
+    In-memory databases live and die with their connection, so they get
+    a ``StaticPool``: every session reuses the one connection (and the
+    one schema) regardless of which thread asks.
+    """
     global _engine, _SessionFactory
     _SessionFactory = None
+    extra = {"poolclass": StaticPool} if _is_memory_url(url) else {}
     _engine = create_engine(
         url,
         connect_args={"check_same_thread": False},
         echo=False,
+        **extra,
     )
 
 
-def _run_migrations(engine) -> None:
+def _run_migrations(conn) -> None:
     """Schema migrations for existing databases.
 
     Runs after ``create_all`` so new columns exist in fresh installs.
-    Each migration is idempotent — safe to run repeatedly.
+    Each migration is idempotent — safe to run repeatedly.  Works inside
+    the caller's transaction on *conn*; committing is up to the caller.
     """
-    insp = inspect(engine)
+    insp = inspect(conn)
     table_names = set(insp.get_table_names())
 
-    with engine.connect() as conn:
-        # ── M1: add xp_awarded column to sessions ──────────────────────
-        if "sessions" in table_names:
-            columns = {c["name"] for c in insp.get_columns("sessions")}
-            if "xp_awarded" not in columns:
-                conn.execute(text(
-                    "ALTER TABLE sessions "
-                    "ADD COLUMN xp_awarded BOOLEAN NOT NULL DEFAULT 0"
-                ))
-
-        # ── M2: rename character → companion in unlocks ────────────────
-        if "unlocks" in table_names:
+    # ── M1: add xp_awarded column to sessions ──────────────────────────
+    if "sessions" in table_names:
+        columns = {c["name"] for c in insp.get_columns("sessions")}
+        if "xp_awarded" not in columns:
             conn.execute(text(
-                "UPDATE unlocks SET unlock_type = 'companion' "
-                "WHERE unlock_type = 'character'"
+                "ALTER TABLE sessions "
+                "ADD COLUMN xp_awarded BOOLEAN NOT NULL DEFAULT 0"
             ))
 
-            # Rename old theme keys to new ones
-            _theme_renames = {
-                "default": "midnight",
-                "ocean_breeze": "ocean",
-                "dark_forest": "forest",
-                "sunset_fire": "sunset",
-                "midnight_pro": "neon",
-            }
-            for old_key, new_key in _theme_renames.items():
-                conn.execute(text(
-                    "UPDATE unlocks SET unlock_key = :new "
-                    "WHERE unlock_type = 'theme' AND unlock_key = :old"
-                ), {"old": old_key, "new": new_key})
-
-            # Rename old companion keys
-            _companion_renames = {
-                "apprentice": "sprout",
-                "scholar": "ember",
-                "warrior": "ripple",
-                "mage": "pixel",
-                "legend": "zen",
-            }
-            for old_key, new_key in _companion_renames.items():
-                conn.execute(text(
-                    "UPDATE unlocks SET unlock_key = :new "
-                    "WHERE unlock_type = 'companion' AND unlock_key = :old"
-                ), {"old": old_key, "new": new_key})
-
-        conn.commit()
+    # ── M2: rename character → companion in unlocks ────────────────────
+    if "unlocks" in table_names:
+        conn.execute(text(
+            "UPDATE unlocks SET unlock_type = 'companion' "
+            "WHERE unlock_type = 'character'"
+        ))
+
+        # Rename old theme keys to new ones
+        _theme_renames = {
+            "default": "midnight",
+            "ocean_breeze": "ocean",
+            "dark_forest": "forest",
+            "sunset_fire": "sunset",
+            "midnight_pro": "neon",
+        }
+        for old_key, new_key in _theme_renames.items():
+            conn.execute(text(
+                "UPDATE unlocks SET unlock_key = :new "
+                "WHERE unlock_type = 'theme' AND unlock_key = :old"
+            ), {"old": old_key, "new": new_key})
+
+        # Rename old companion keys
+        _companion_renames = {
+            "apprentice": "sprout",
+            "scholar": "ember",
+            "warrior": "ripple",
+            "mage": "pixel",
+            "legend": "zen",
+        }
+        for old_key, new_key in _companion_renames.items():
+            conn.execute(text(
+                "UPDATE unlocks SET unlock_key = :new "
+                "WHERE unlock_type = 'companion' AND unlock_key = :old"
+            ), {"old": old_key, "new": new_key})
 
 
 def init_db() -> None:
     """Create all tables, run migrations, and seed defaults."""
     engine = _get_engine()
     Base.metadata.create_all(engine)
-    _run_migrations(engine)
+    with engine.connect() as conn:
+        _run_migrations(conn)
+        conn.commit()
 
     # Seed default UserProgress row
     factory = _get_session_factory()
     with factory() as session:
         if session.query(UserProgress).count() == 0:
-            session.add(UserProgress())
+            session.add(UserProgress(id=USER_PROGRESS_ID))
             session.commit()
 
 
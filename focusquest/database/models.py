@@ -32,6 +32,10 @@ class Session(Base):
         )
 
 
+# Primary key of the single UserProgress row seeded by ``init_db``.
+USER_PROGRESS_ID = 1
+
+
 class UserProgress(Base):
     """Single-row table tracking overall user progress."""
 
@@ -38,6 +38,7 @@ exposes look‑up helpers (``get``, ``next_upcoming``, ``teasers``).
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -488,6 +489,21 @@ class UnlockRegistry:
                 definition=t,
             )
 
+        # The catalogue is fixed after import, so index it once
+        by_type: dict[str, list[UnlockableItem]] = {}
+        for item in self._items.values():
+            by_type.setdefault(item.unlock_type, []).append(item)
+        self._by_type: dict[str, tuple[UnlockableItem, ...]] = {
+            t: tuple(items) for t, items in by_type.items()
+        }
+        # Level-gated items in unlock order (stable, so ties keep
+        # catalogue order) with their levels alongside for bisecting
+        self._gated: tuple[UnlockableItem, ...] = tuple(sorted(
+            (i for i in self._items.values() if i.unlock_type != "title"),
+            key=lambda i: i.required_level,
+        ))
+        self._gated_levels: list[int] = [i.required_level for i in self._gated]
+
     # ── queries ─────────────────────────────────────────────────────
 
     def all_items(self) -> list[UnlockableItem]:
@@ -497,26 +513,17 @@ class UnlockRegistry:
         return self._items.get((unlock_type, key))
 
     def items_by_type(self, unlock_type: str) -> list[UnlockableItem]:
-        return [i for i in self._items.values() if i.unlock_type == unlock_type]
+        return list(self._by_type.get(unlock_type, ()))
 
     def next_upcoming(self, current_level: int) -> UnlockableItem | None:
         """Return the lowest‑level unlockable the player hasn't reached yet."""
-        candidates = [
-            i for i in self._items.values()
-            if i.required_level > current_level and i.unlock_type != "title"
-        ]
-        if not candidates:
-            return None
-        return min(candidates, key=lambda i: i.required_level)
+        idx = bisect_right(self._gated_levels, current_level)
+        return self._gated[idx] if idx < len(self._gated) else None
 
     def teasers(self, current_level: int, count: int = 3) -> list[UnlockableItem]:
         """Return the next *count* upcoming level‑gated unlockables."""
-        candidates = sorted(
-            (i for i in self._items.values()
-             if i.required_level > current_level and i.unlock_type != "title"),
-            key=lambda i: i.required_level,
-        )
-        return candidates[:count]
+        idx = bisect_right(self._gated_levels, current_level)
+        return list(self._gated[idx:idx + count])
 
 
 # Module‑level singleton
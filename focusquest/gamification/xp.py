@@ -43,9 +43,11 @@ if an event is replayed.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import date
 
 from PyQt6.QtCore import QObject, pyqtSignal
+from sqlalchemy import update
 
 from ..database.db import get_session
 from ..database.models import UserProgress, DailyStats, Session as PomSession
@@ -68,6 +70,16 @@ def _xp_delta(level: int) -> int:
     return round(BASE_XP_PER_LEVEL * (LEVEL_SCALING ** (level - 1)))
 
 
+# Cumulative XP to reach each level, worked out once at import:
+# ``_XP_CUM[level]`` for ``level`` in ``0 .. _TABLE_LEVELS``.  Level 100
+# is well past a lifetime of pomodoros; beyond it the formula takes over.
+_TABLE_LEVELS = 100
+_XP_CUM: list[int] = [0, 0]
+for _lvl in range(1, _TABLE_LEVELS):
+    _XP_CUM.append(_XP_CUM[-1] + _xp_delta(_lvl))
+del _lvl
+
+
 def xp_for_level(level: int) -> int:
     """Total cumulative XP required to *reach* the given level.
 
@@ -75,14 +87,24 @@ def xp_for_level(level: int) -> int:
     """
     if level <= 1:
         return 0
-    return sum(_xp_delta(l) for l in range(1, level))
+    if level <= _TABLE_LEVELS:
+        return _XP_CUM[level]
+    return _XP_CUM[-1] + sum(_xp_delta(l) for l in range(_TABLE_LEVELS, level))
 
 
 def level_for_xp(total_xp: int) -> int:
     """Return the level a player is at given their total XP."""
-    level = 1
-    while xp_for_level(level + 1) <= total_xp:
+    # _XP_CUM is sorted with two leading zeros: bisecting lands one past
+    # the highest level whose threshold has been met.
+    level = max(1, bisect_right(_XP_CUM, total_xp) - 1)
+    if level < _TABLE_LEVELS:
+        return level
+    # Past the table: walk on one delta at a time instead of re-summing
+    # the whole curve for every candidate level.
+    needed = _XP_CUM[-1] + _xp_delta(level)
+    while needed <= total_xp:
         level += 1
+        needed += _xp_delta(level)
     return level
 
 
@@ -114,12 +136,15 @@ LEVEL_TITLES: list[tuple[int, str]] = [
 ]
 
 
+# The same bands ascending, split into columns for bisecting
+_TITLE_THRESHOLDS = [threshold for threshold, _ in reversed(LEVEL_TITLES)]
+_TITLES_ASCENDING = [title for _, title in reversed(LEVEL_TITLES)]
+
+
 def title_for_level(level: int) -> str:
     """Return the fun title for *level*."""
-    for threshold, title in LEVEL_TITLES:
-        if level >= threshold:
-            return title
-    return "Focus Apprentice"
+    idx = bisect_right(_TITLE_THRESHOLDS, level) - 1
+    return _TITLES_ASCENDING[idx] if idx >= 0 else "Focus Apprentice"
 
 
 # ── XP engine ────────────────────────────────────────────────────────────
@@ -208,12 +233,19 @@ class XPEngine(QObject):
 
         with get_session() as db:
             # ── idempotency guard ────────────────────────────────────
+            # Check-and-set in one statement; a miss means the row is
+            # either already awarded or gone (unknown ids still earn XP).
             if db_session_id is not None:
-                pom = db.get(PomSession, db_session_id)
-                if pom is not None and pom.xp_awarded:
+                claimed = db.execute(
+                    update(PomSession)
+                    .where(
+                        PomSession.id == db_session_id,
+                        PomSession.xp_awarded.is_(False),
+                    )
+                    .values(xp_awarded=True)
+                ).rowcount
+                if not claimed and db.get(PomSession, db_session_id) is not None:
                     return _empty
-                if pom is not None:
-                    pom.xp_awarded = True
 
             progress: UserProgress = db.query(UserProgress).first()
             bonuses: list[dict[str, object]] = []
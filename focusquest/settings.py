@@ -52,15 +52,18 @@ class Settings:
     compact_mode: bool = False
 
 
+# Keys load_settings() accepts — worked out once, not per load
+_FIELD_NAMES = frozenset(f.name for f in fields(Settings))
+
+
 def load_settings() -> Settings:
     """Load settings from disk, falling back to defaults."""
     try:
-        if SETTINGS_PATH.exists():
-            data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
-            # Only use keys that exist in the dataclass
-            valid_keys = {f.name for f in fields(Settings)}
-            filtered = {k: v for k, v in data.items() if k in valid_keys}
-            return Settings(**filtered)
+        # A missing file raises FileNotFoundError → defaults below
+        data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+        # Only use keys that exist in the dataclass
+        filtered = {k: v for k, v in data.items() if k in _FIELD_NAMES}
+        return Settings(**filtered)
     except Exception:
         pass
     return Settings()
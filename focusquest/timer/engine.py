@@ -27,11 +27,15 @@ ADHD-friendly design choices
 
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session as OrmSession
+
 
 # ── enums ─────────────────────────────────────────────────────────────────
 
@@ -68,6 +72,10 @@ _SESSION_TO_TIMER_STATE: dict[SessionType, TimerState] = {
     SessionType.LONG_BREAK: TimerState.LONG_BREAK,
 }
 
+# Wall clock for session timestamps (and so the streak date).  A module
+# attribute so tests can pin it to one fixed moment.
+_now = datetime.now
+
 
 # ── engine ────────────────────────────────────────────────────────────────
 
@@ -88,7 +96,8 @@ class TimerEngine(QObject):
         ``end_time``, ``task_label``, ``round_number``, ``was_micro``,
         ``extensions``.
     streak_updated(current_streak: int, longest_streak: int)
-        Emitted after a work session updates the daily streak.
+        Emitted after a work session moves the daily streak on (not
+        for further sessions on an already-counted day).
     """
 
     tick = pyqtSignal(int)
@@ -128,6 +137,9 @@ class TimerEngine(QObject):
 
         # ── DB tracking ───────────────────────────────────────────────
         self._db_session_id: int | None = None
+        # Last day this engine rolled the streak for; the engine is the
+        # only writer of the streak, so a repeat day needs no query.
+        self._streak_day: date | None = None
 
         # ── break warning ────────────────────────────────────────────
         self._break_warning_fired: bool = False
@@ -208,7 +220,7 @@ class TimerEngine(QObject):
     def set_duration(self, session_type: SessionType, seconds: int) -> None:
         """Override a default duration (minimum 60 s)."""
         self._durations[session_type] = max(60, seconds)
-        if self._state == TimerState.IDLE and self._session_type == session_type:
+        if self._state is TimerState.IDLE and self._session_type is session_type:
             self._remaining = self._durations[session_type]
             self._session_duration = self._remaining
 
@@ -218,7 +230,7 @@ class TimerEngine(QObject):
 
     def start(self) -> None:
         """Begin the next session.  Only valid from IDLE."""
-        if self._state != TimerState.IDLE:
+        if self._state is not TimerState.IDLE:
             return
         self._begin_session(
             self._session_type,
@@ -231,7 +243,7 @@ class TimerEngine(QObject):
         Only valid from IDLE.  The micro flag is recorded in the
         ``session_completed`` signal data.
         """
-        if self._state != TimerState.IDLE:
+        if self._state is not TimerState.IDLE:
             return
         self._is_micro = True
         self._session_type = SessionType.WORK
@@ -247,7 +259,7 @@ class TimerEngine(QObject):
 
     def resume(self) -> None:
         """Resume from PAUSED back to whatever was running."""
-        if self._state != TimerState.PAUSED or self._paused_from is None:
+        if self._state is not TimerState.PAUSED or self._paused_from is None:
             return
         restore_to = self._paused_from
         self._paused_from = None
@@ -291,11 +303,12 @@ class TimerEngine(QObject):
         The "+5 more minutes" button for flow state.  Only works for
         work sessions.
         """
-        active = self._state
-        if self._state == TimerState.PAUSED and self._paused_from:
-            active = self._paused_from
-        if active != TimerState.WORKING:
-            return
+        active = (
+            self._paused_from if self._state is TimerState.PAUSED
+            else self._state
+        )
+        if active is not TimerState.WORKING:
+            return  # no-op: nothing mutated, no tick emitted
 
         self._remaining += seconds
         self._session_duration += seconds
@@ -312,25 +325,35 @@ class TimerEngine(QObject):
         self._session_type = session_type
         self._remaining = duration
         self._session_duration = duration
-        self._start_time = datetime.now()
+        self._start_time = _now()
         self._extensions = 0
         self._break_warning_fired = False
 
         if self._db_enabled:
-            self._persist_start()
+            from ..database.db import get_session
+            with get_session() as db:
+                self._persist_start(db)
 
         self._set_state(_SESSION_TO_TIMER_STATE[session_type])
         self._qt_timer.start()
 
     def _on_tick(self) -> None:
-        self._remaining = max(0, self._remaining - 1)
+        self._tick_many(1)
+
+    def _tick_many(self, n: int) -> None:
+        """Count down *n* seconds at once, emitting a single ``tick``."""
+        before = self._remaining
+        self._remaining = max(0, before - n)
         self.tick.emit(self._remaining)
 
-        # Break ending warning — fires once at 60 s remaining during breaks
+        # Break ending warning — fires once at 60 s remaining during breaks.
+        # The seconds passed through are before-1 … remaining; one of them
+        # lies in (0, 60] exactly when this holds:
         if (
             not self._break_warning_fired
             and self._state in (TimerState.SHORT_BREAK, TimerState.LONG_BREAK)
-            and 0 < self._remaining <= 60
+            and self._remaining <= 60
+            and before > 1
         ):
             self._break_warning_fired = True
             self.break_ending_soon.emit()
@@ -340,14 +363,16 @@ class TimerEngine(QObject):
 
     def _finish_session(self) -> None:
         self._qt_timer.stop()
-        end_time = datetime.now()
+        end_time = _now()
         completed_type = self._session_type
         completed_round = self._round
         completed_db_id = self._db_session_id  # capture before persist clears it
 
         # ── persist completion ────────────────────────────────────────
-        if self._db_enabled:
-            self._persist_completed(end_time)
+        if self._db_enabled and self._db_session_id is not None:
+            from ..database.db import get_session
+            with get_session() as db:
+                self._persist_completed(db, end_time)
 
         # ── emit session data ─────────────────────────────────────────
         self.session_completed.emit({
@@ -363,23 +388,36 @@ class TimerEngine(QObject):
             "db_session_id": completed_db_id,
         })
 
-        # ── streak (work sessions only) ───────────────────────────────
-        if completed_type == SessionType.WORK and self._db_enabled:
-            current, longest = self._update_streak(end_time.date())
-            self.streak_updated.emit(current, longest)
-
         # ── advance cycle ─────────────────────────────────────────────
         self._advance()
         self._is_micro = False
         self._extensions = 0
         self._remaining = self._durations[self._session_type]
         self._session_duration = self._remaining
+        if self._auto_advance:
+            self._start_time = _now()
+
+        # ── streak + next session's row: one transaction ──────────────
+        # (after session_completed, so XP still sees yesterday's streak)
+        session_day = end_time.date()
+        update_streak = (
+            completed_type is SessionType.WORK
+            and session_day != self._streak_day
+        )
+        streak: tuple[int, int] | None = None
+        if self._db_enabled and (update_streak or self._auto_advance):
+            from ..database.db import get_session
+            with get_session() as db:
+                if update_streak:
+                    streak = self._update_streak(db, session_day)
+                    self._streak_day = session_day
+                if self._auto_advance:
+                    self._persist_start(db)
+        if streak is not None:
+            self.streak_updated.emit(*streak)
 
         # ── auto-advance or wait for click ────────────────────────────
         if self._auto_advance:
-            self._start_time = datetime.now()
-            if self._db_enabled:
-                self._persist_start()
             self._set_state(_SESSION_TO_TIMER_STATE[self._session_type])
             self._qt_timer.start()
         else:
@@ -389,7 +427,7 @@ class TimerEngine(QObject):
 
     def _advance(self) -> None:
         """Move ``session_type`` and ``round`` to the next position."""
-        if self._session_type == SessionType.WORK:
+        if self._session_type is SessionType.WORK:
             # After work → break
             if self._round >= self._rounds_per_cycle:
                 self._session_type = SessionType.LONG_BREAK
@@ -397,7 +435,7 @@ class TimerEngine(QObject):
                 self._session_type = SessionType.SHORT_BREAK
         else:
             # After any break → work
-            if self._session_type == SessionType.LONG_BREAK:
+            if self._session_type is SessionType.LONG_BREAK:
                 self._round = 1
             else:
                 self._round += 1
@@ -411,56 +449,75 @@ class TimerEngine(QObject):
     #  INTERNAL — database persistence
     # ══════════════════════════════════════════════════════════════════
 
-    def _persist_start(self) -> None:
-        from ..database.db import get_session
+    # Each helper works inside the caller's ``get_session()`` block so
+    # writes that happen together share one transaction.
+
+    # Session rows are written with Core statements: the engine only
+    # needs the new id back, not a tracked ORM object.
+
+    def _persist_start(self, db: OrmSession) -> None:
+        from sqlalchemy import insert
         from ..database.models import Session as PomSession
 
-        with get_session() as db:
-            record = PomSession(
-                start_time=self._start_time,
-                session_type=self._session_type.value,
-                completed=False,
-                task_label=self._task_label or None,
-            )
-            db.add(record)
-            db.flush()
-            self._db_session_id = record.id
+        result = db.execute(insert(PomSession).values(
+            start_time=self._start_time,
+            session_type=self._session_type.value,
+            completed=False,
+            task_label=self._task_label or None,
+        ))
+        self._db_session_id = result.inserted_primary_key[0]
 
-    def _persist_completed(self, end_time: datetime) -> None:
-        if self._db_session_id is None:
-            return
-        from ..database.db import get_session
+    def _persist_completed(self, db: OrmSession, end_time: datetime) -> None:
+        from sqlalchemy import update
         from ..database.models import Session as PomSession
 
-        with get_session() as db:
-            record = db.get(PomSession, self._db_session_id)
-            if record:
-                record.end_time = end_time
-                record.duration_seconds = self._session_duration
-                record.completed = True
+        db.execute(
+            update(PomSession)
+            .where(PomSession.id == self._db_session_id)
+            .values(
+                end_time=end_time,
+                duration_seconds=self._session_duration,
+                completed=True,
+            )
+        )
         self._db_session_id = None
 
-    def _update_streak(self, session_date: date) -> tuple[int, int]:
-        from ..database.db import get_session
-        from ..database.models import UserProgress
-
-        with get_session() as db:
-            progress: UserProgress = db.query(UserProgress).first()
-            if progress is None:
-                return (0, 0)
-
-            last = progress.last_session_date
-            if last is None:
-                progress.current_streak_days = 1
-            elif (session_date - last).days == 1:
-                progress.current_streak_days += 1
-            elif (session_date - last).days == 0:
-                pass  # same calendar day — no change
-            else:
-                progress.current_streak_days = 1  # streak broken
+    def _update_streak(
+        self, db: OrmSession, session_date: date,
+    ) -> tuple[int, int] | None:
+        """Roll the daily streak forward to *session_date*.
 
-            progress.last_session_date = session_date
-            if progress.current_streak_days > progress.longest_streak_days:
-                progress.longest_streak_days = progress.current_streak_days
+        One ``UPDATE … RETURNING`` does the read-modify-write in SQLite.
+        Returns ``(current, longest)``, or ``None`` when nothing was
+        written (the day was already counted, or there is no progress
+        row).
+        """
+        from sqlalchemy import case, func, or_, update
+        from ..database.models import UserProgress
 
-            return (progress.current_streak_days, progress.longest_streak_days)
+        last = UserProgress.last_session_date
+        current = case(
+            (last == session_date - timedelta(days=1),
+             UserProgress.current_streak_days + 1),
+            else_=1,  # first session ever, or streak broken
+        )
+        row = db.execute(
+            update(UserProgress)
+            .where(or_(
+                last.is_(None),
+                last != session_date,
+                UserProgress.current_streak_days <= 0,
+            ))
+            .values(
+                current_streak_days=current,
+                longest_streak_days=func.max(
+                    UserProgress.longest_streak_days, current,
+                ),
+                last_session_date=session_date,
+            )
+            .returning(
+                UserProgress.current_streak_days,
+                UserProgress.longest_streak_days,
+            )
+        ).first()
+        return (row[0], row[1]) if row is not None else None
@@ -44,6 +44,17 @@ def _lerp_color(c1: QColor, c2: QColor, t: float) -> QColor:
 
 # ── sparkle particle ────────────────────────────────────────────────────────
 
+# Parsed once at import; particles share these instances
+_CELEBRATION_COLORS = (
+    QColor("#FFD700"),  # gold
+    QColor("#FF6B6B"),  # coral
+    QColor("#A6E3A1"),  # green
+    QColor("#89B4FA"),  # blue
+    QColor("#CBA6F7"),  # purple
+    QColor("#F9E2AF"),  # yellow
+)
+
+
 class _Particle:
     __slots__ = ("x", "y", "vx", "vy", "life", "color", "size")
 
@@ -55,7 +66,7 @@ class _Particle:
         self.vx = math.cos(angle) * speed
         self.vy = math.sin(angle) * speed
         self.life = 1.0
-        self.color = QColor(color)
+        self.color = color  # shared, read-only — paintEvent copies it
         self.size = random.uniform(3, 7)
 
     def tick(self, dt: float) -> bool:
@@ -266,8 +277,15 @@ class ProgressRing(QWidget):
     def _on_particle_tick(self) -> None:
         """Advance celebration particles."""
         dt = 0.016
-        self._particles = [p for p in self._particles if p.tick(dt)]
-        if not self._particles:
+        # Compact survivors in place — no new list per frame
+        particles = self._particles
+        alive = 0
+        for p in particles:
+            if p.tick(dt):
+                particles[alive] = p
+                alive += 1
+        del particles[alive:]
+        if not particles:
             self._particle_timer.stop()
         self.update()
 
@@ -277,20 +295,11 @@ class ProgressRing(QWidget):
         cy = self.height() / 2
         radius = self.RING_DIAMETER / 2
 
-        colors = [
-            QColor("#FFD700"),  # gold
-            QColor("#FF6B6B"),  # coral
-            QColor("#A6E3A1"),  # green
-            QColor("#89B4FA"),  # blue
-            QColor("#CBA6F7"),  # purple
-            QColor("#F9E2AF"),  # yellow
-        ]
-
         for _ in range(40):
             angle = random.uniform(0, 2 * math.pi)
             px = cx + math.cos(angle) * radius
             py = cy + math.sin(angle) * radius
-            color = random.choice(colors)
+            color = random.choice(_CELEBRATION_COLORS)
             self._particles.append(_Particle(px, py, color))
 
         if not self._particle_timer.isActive():
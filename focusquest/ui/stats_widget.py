@@ -96,6 +96,40 @@ class _StatsCache:
     next_unlock: object | None = None
 
 
+def _load_stats_version() -> tuple:
+    """Cheap fingerprint of everything ``_load_stats`` reads.
+
+    One round-trip of scalar aggregates; if it matches the previous
+    value the full set of dashboard queries can be skipped.
+    """
+    from sqlalchemy import func, select
+
+    progress_cols = (
+        UserProgress.total_xp,
+        UserProgress.current_level,
+        UserProgress.total_sessions_completed,
+        UserProgress.total_focus_minutes,
+        UserProgress.current_streak_days,
+        UserProgress.longest_streak_days,
+    )
+    stmt = select(
+        select(func.max(Session.id)).scalar_subquery(),
+        select(func.count()).where(Session.completed.is_(True))
+        .scalar_subquery(),
+        select(func.max(DailyStats.id)).scalar_subquery(),
+        select(func.total(DailyStats.sessions_completed)).scalar_subquery(),
+        select(func.total(DailyStats.focus_minutes)).scalar_subquery(),
+        select(func.total(DailyStats.xp_earned)).scalar_subquery(),
+        *(
+            select(col).order_by(UserProgress.id).limit(1).scalar_subquery()
+            for col in progress_cols
+        ),
+    )
+    with get_session() as db:
+        row = db.execute(stmt).one()
+    return (date.today(), *row)
+
+
 def _load_stats() -> _StatsCache:
     """Run all queries in a single session and return a filled cache."""
     cache = _StatsCache()
@@ -742,6 +776,7 @@ class StatsWidget(QWidget):
         super().__init__(parent)
         self._palette: dict[str, str] = {}
         self._cache: _StatsCache | None = None
+        self._cache_version: tuple | None = None
         self._build_ui()
         # Defer initial refresh so the window appears before the DB queries run
         from PyQt6.QtCore import QTimer
@@ -925,9 +960,17 @@ class StatsWidget(QWidget):
     # ── refresh ───────────────────────────────────────────────────────────
 
     def refresh(self) -> None:
-        """Pull fresh data from the DB and update all widgets."""
+        """Pull fresh data from the DB and update all widgets.
+
+        Skipped when nothing the dashboard shows has changed since the
+        last refresh.
+        """
+        version = _load_stats_version()
+        if self._cache is not None and version == self._cache_version:
+            return
         cache = _load_stats()
         self._cache = cache
+        self._cache_version = version
 
         # [1] Today's Summary
         self._session_ring.set_data(cache.today_sessions, self.SESSION_TARGET)
@@ -977,6 +1020,8 @@ class StatsWidget(QWidget):
 
     def apply_palette(self, palette: dict[str, str]) -> None:
         """Re-color all charts and inline-styled labels."""
+        if palette == self._palette:
+            return  # same theme re-applied — every widget is already coloured
         self._palette = palette
         accent = palette.get("accent", "#CBA6F7")
         accent2 = palette.get("accent2", "#B4BEFE")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..timer.engine import TimerState
 
 # ── state colors (ring gradient pairs) — GLOBAL DEFAULTS ────────────────
@@ -33,6 +35,16 @@ _DEFAULT_PALETTE: dict[str, str] = {
 }
 
 
+# ── colour helpers ───────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=256)
+def hex_to_rgba(hex_color: str, alpha: int) -> str:
+    """Convert '#RRGGBB' + 0-255 alpha to 'rgba(R, G, B, A)'."""
+    r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
 # ── palette + ring‑colour look‑ups (driven by unlock registry) ──────────
 
 
@@ -149,8 +161,13 @@ def resolve_font_family() -> str:
 
 
 def build_stylesheet(palette: dict[str, str]) -> str:
-    p = palette
-    font = resolve_font_family()
+    """Return the application QSS for *palette* (memoised per palette)."""
+    return _build_stylesheet(frozenset(palette.items()), resolve_font_family())
+
+
+@lru_cache(maxsize=32)
+def _build_stylesheet(items: frozenset[tuple[str, str]], font: str) -> str:
+    p = dict(items)
     return f"""
     /* ── global ─────────────────────────────────── */
     QWidget {{
@@ -377,3 +394,19 @@ def build_stylesheet(palette: dict[str, str]) -> str:
         border-top: 1px solid {p['border']};
     }}
     """
+
+
+def apply_global_stylesheet(palette: dict[str, str]) -> None:
+    """Install the QSS for *palette* once on the QApplication.
+
+    Qt parses the sheet a single time and every widget inherits it, rather
+    than each top-level window carrying (and re-parsing) its own copy.
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        return
+    qss = build_stylesheet(palette)
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
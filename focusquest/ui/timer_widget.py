@@ -9,10 +9,13 @@ Layout (top → bottom):
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from dataclasses import dataclass
+
+from PyQt6.QtCore import Qt, QRectF, pyqtSignal
+from PyQt6.QtGui import QPainter, QPen, QColor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QLineEdit, QFrame, QSizePolicy,
+    QPushButton, QLineEdit, QFrame, QSizePolicy,
 )
 
 from ..timer.engine import TimerEngine, TimerState, SessionType
@@ -35,6 +38,99 @@ NEXT_SESSION_LABELS: dict[SessionType, str] = {
 }
 
 
+@dataclass(frozen=True)
+class _StateView:
+    """Everything ``_on_state_changed`` derives from a TimerState."""
+
+    button_text: str
+    ring_label: str | None    # None → use NEXT_SESSION_LABELS (idle)
+    companion_state: str
+    round_finished: bool      # dots include the current round
+
+
+# One lookup per state transition instead of several dict probes + branches.
+_STATE_LUT: dict[TimerState, _StateView] = {
+    TimerState.IDLE: _StateView(
+        "Start", None, "idle", False),
+    TimerState.WORKING: _StateView(
+        "Pause", SESSION_LABELS[TimerState.WORKING], "focus", False),
+    TimerState.SHORT_BREAK: _StateView(
+        "Pause", SESSION_LABELS[TimerState.SHORT_BREAK], "idle", True),
+    TimerState.LONG_BREAK: _StateView(
+        "Pause", SESSION_LABELS[TimerState.LONG_BREAK], "idle", True),
+    TimerState.PAUSED: _StateView(
+        "Resume", SESSION_LABELS[TimerState.PAUSED], "sleep", True),
+}
+
+
+# ── round dot strip ─────────────────────────────────────────────────────────
+
+
+class _DotStrip(QWidget):
+    """Row of round indicator dots (filled = completed) painted in one pass."""
+
+    DOT_COUNT = 4
+    DOT_DIAMETER = 12
+    DOT_SPACING = 10
+    PEN_WIDTH = 1.5
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        width = (
+            self.DOT_COUNT * self.DOT_DIAMETER
+            + (self.DOT_COUNT - 1) * self.DOT_SPACING
+        )
+        self.setFixedSize(width + 4, self.DOT_DIAMETER + 8)
+        self._filled = 0
+        self._color_key: tuple[str, str] = ("#CBA6F7", "#7A7A9A")
+        self._accent = QColor("#CBA6F7")
+        self._muted = QColor("#7A7A9A")
+
+    @property
+    def filled(self) -> int:
+        return self._filled
+
+    def set_filled(self, count: int) -> None:
+        count = max(0, min(count, self.DOT_COUNT))
+        if count == self._filled:
+            return
+        self._filled = count
+        self.update()
+
+    def set_colors(self, accent: str, muted: str) -> None:
+        if (accent, muted) == self._color_key:
+            return
+        self._color_key = (accent, muted)
+        self._accent = QColor(accent)
+        self._muted = QColor(muted)
+        self.update()
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        d = self.DOT_DIAMETER
+        inset = self.PEN_WIDTH / 2
+        x = (self.width() - (
+            self.DOT_COUNT * d + (self.DOT_COUNT - 1) * self.DOT_SPACING
+        )) / 2
+        y = (self.height() - d) / 2
+
+        muted_pen = QPen(self._muted, self.PEN_WIDTH)
+        for i in range(self.DOT_COUNT):
+            rect = QRectF(x + inset, y + inset, d - 2 * inset, d - 2 * inset)
+            if i < self._filled:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(self._accent)
+            else:
+                painter.setPen(muted_pen)
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(rect)
+            x += d + self.DOT_SPACING
+
+        painter.end()
+
+
 class TimerWidget(QWidget):
     """The main timer card shown in the Focus tab."""
 
@@ -144,14 +240,8 @@ class TimerWidget(QWidget):
         # ── round dot indicators (4 dots = one cycle) ────────────────
         dot_row = QHBoxLayout()
         dot_row.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dot_row.setSpacing(10)
-        self._dots: list[QLabel] = []
-        for _ in range(4):
-            dot = QLabel("○", card)
-            dot.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            dot.setStyleSheet("font-size: 18px;")
-            self._dots.append(dot)
-            dot_row.addWidget(dot)
+        self._dots = _DotStrip(card)
+        dot_row.addWidget(self._dots)
         layout.addLayout(dot_row)
 
     # ── signals ───────────────────────────────────────────────────────────
@@ -184,20 +274,19 @@ class TimerWidget(QWidget):
         self.task_label_changed.emit(text)
 
     def _on_state_changed(self, state: TimerState) -> None:
+        view = _STATE_LUT[state]
+        session_type = self._engine.session_type
+
         # ── button label ──────────────────────────────────────────────
-        if self._engine.is_running:
-            self._start_pause_btn.setText("Pause")
-        elif state == TimerState.PAUSED:
-            self._start_pause_btn.setText("Resume")
-        else:
-            self._start_pause_btn.setText("Start")
+        self._start_pause_btn.setText(view.button_text)
 
         # ── ring state label ─────────────────────────────────────────
-        if state == TimerState.IDLE:
-            lbl = NEXT_SESSION_LABELS.get(self._engine.session_type, "READY")
-            self._ring.set_state_label(lbl)
+        if view.ring_label is None:
+            self._ring.set_state_label(
+                NEXT_SESSION_LABELS.get(session_type, "READY")
+            )
         else:
-            self._ring.set_state_label(SESSION_LABELS.get(state, "FOCUS TIME"))
+            self._ring.set_state_label(view.ring_label)
 
         # ── round indicator ──────────────────────────────────────────
         r = self._engine.current_round
@@ -205,42 +294,20 @@ class TimerWidget(QWidget):
         self._ring.set_round_text(f"Round {r} of {total}")
 
         # ── dot indicators ───────────────────────────────────────────
-        done = r - 1
-        if state in (
-            TimerState.SHORT_BREAK,
-            TimerState.LONG_BREAK,
-            TimerState.PAUSED,
-        ) or (state == TimerState.IDLE
-              and self._engine.session_type != SessionType.WORK):
-            done = r  # show the round we just finished
-        for i, dot in enumerate(self._dots):
-            if i < done:
-                dot.setText("●")
-                if self._palette:
-                    dot.setStyleSheet(
-                        f"font-size: 18px; color: {self._palette.get('accent', '#CBA6F7')};"
-                    )
-            else:
-                dot.setText("○")
-                dot.setStyleSheet(
-                    f"font-size: 18px; color: {self._palette.get('text_muted', '#7A7A9A')};"
-                )
+        # Breaks (and idle before a break) show the round we just finished
+        if view.round_finished or (
+            state == TimerState.IDLE and session_type != SessionType.WORK
+        ):
+            self._dots.set_filled(r)
+        else:
+            self._dots.set_filled(r - 1)
 
         # ── ring colors ──────────────────────────────────────────────
         self._ring.apply_state(state)
 
         # ── companion state ──────────────────────────────────────────
         if self._companion_widget is not None:
-            _COMP_STATE_MAP = {
-                TimerState.IDLE:        "idle",
-                TimerState.WORKING:     "focus",
-                TimerState.SHORT_BREAK: "idle",
-                TimerState.LONG_BREAK:  "idle",
-                TimerState.PAUSED:      "sleep",
-            }
-            self._companion_widget.set_state(
-                _COMP_STATE_MAP.get(state, "idle")
-            )
+            self._companion_widget.set_state(view.companion_state)
 
         # ── button visibility ────────────────────────────────────────
         self._update_button_visibility(state)
@@ -307,8 +374,7 @@ class TimerWidget(QWidget):
         self._task_input.setVisible(not compact)
         if self._companion_widget is not None:
             self._companion_widget.setVisible(not compact)
-        for dot in self._dots:
-            dot.setVisible(not compact)
+        self._dots.setVisible(not compact)
         # Shrink / restore ring
         size = 240 if compact else 340
         self._ring.setFixedSize(size, size)
@@ -324,5 +390,9 @@ class TimerWidget(QWidget):
     ) -> None:
         self._palette = palette
         self._ring.apply_palette(palette)
+        self._dots.set_colors(
+            palette.get("accent", "#CBA6F7"),
+            palette.get("text_muted", "#7A7A9A"),
+        )
         if ring_colors is not None:
             self._ring.set_ring_colors(ring_colors)
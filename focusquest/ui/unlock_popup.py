@@ -6,24 +6,21 @@ card, gold sparkle text, and a click-to-dismiss interaction.
 
 from __future__ import annotations
 
-import random
+from functools import lru_cache
+
+import numpy as np
 
 from PyQt6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, QPointF,
+    Qt, QTimer, QElapsedTimer, QPropertyAnimation, QEasingCurve,
+    QPointF, QRect, QRectF,
 )
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGraphicsOpacityEffect
 
 from ..gamification.unlockables import UnlockableItem
 
 
-def _hex_to_rgba(hex_color: str, alpha: int) -> str:
-    """Convert '#RRGGBB' + 0-255 alpha to 'rgba(R, G, B, A)'."""
-    h = hex_color.lstrip("#")
-    r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    return f"rgba({r}, {g}, {b}, {alpha})"
-
-
+@lru_cache(maxsize=256)
 def _lighten(hex_color: str, amount: float = 0.35) -> str:
     """Lighten a hex colour towards white by *amount* (0-1)."""
     h = hex_color.lstrip("#")
@@ -34,37 +31,70 @@ def _lighten(hex_color: str, amount: float = 0.35) -> str:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+def _step_particles(px, py, vx, vy, life, k):
+    """Advance the sparkle arrays in place; return the alive mask.
+
+    *k* is the elapsed time in reference steps (1/30 s), so the motion is
+    the same whatever the timer interval or jitter.
+    """
+    px += vx * k
+    py += vy * k
+    vy += 0.06 * k
+    life -= 0.02 * k
+    return life > 0
+
+
 class UnlockPopup(QWidget):
     """Full-width overlay celebrating a new unlock."""
 
     DISPLAY_MS = 3500
     FADE_IN_MS = 400
     FADE_OUT_MS = 600
+    PARTICLE_COUNT = 20
+    PARTICLE_INTERVAL_MS = 33  # ~30 fps; the physics itself is dt-scaled
+    PARTICLE_STEP_S = 1 / 30   # reference step the sparkle constants assume
+    PARTICLE_MAX_DT_S = 0.1    # clamp after a stall instead of teleporting
+    PARTICLE_MARGIN = 6  # ≥ max sparkle radius, pads the dirty rect
+    CARD_RADIUS = 14
+    CARD_BORDER = 2
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setFixedWidth(300)
+        # The rounded card is painted by hand; Qt must not pre-fill the rect
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self._card_path = QPainterPath()
         self.hide()
 
         self._palette: dict[str, str] = {}
+        self._layout_sig: tuple | None = None  # last text/parent laid out
 
         self._build_ui()
+        self._update_sparkle_colors()
 
         # Opacity
         self._opacity = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(self._opacity)
         self._opacity.setOpacity(0.0)
 
-        self._fade_anim = QPropertyAnimation(self._opacity, b"opacity", self)
+        # Most sessions never unlock anything — build the animation on
+        # first show.  The dismiss timer is restarted, never recreated.
+        self._fade_anim: QPropertyAnimation | None = None
+        self._fading_out: bool = False
 
         self._dismiss_timer = QTimer(self)
         self._dismiss_timer.setSingleShot(True)
         self._dismiss_timer.timeout.connect(self._fade_out)
 
-        # Sparkle particles
-        self._particles: list[dict] = []
+        # Sparkle particles — structure-of-arrays, one entry per particle
+        self._rng = np.random.default_rng()
+        self._clear_particles()
+        self._scratch_color = QColor()  # reused per particle in paintEvent
+        self._particle_rect = QRect()   # area covered on the last frame
+        self._particle_clock = QElapsedTimer()
         self._particle_timer = QTimer(self)
-        self._particle_timer.setInterval(33)
+        self._particle_timer.setInterval(self.PARTICLE_INTERVAL_MS)
         self._particle_timer.timeout.connect(self._tick_particles)
 
     # ── build ──────────────────────────────────────────────────────────
@@ -102,25 +132,37 @@ class UnlockPopup(QWidget):
         bg = self._palette.get("bg_secondary", "#232340")
         warning = self._palette.get("warning", "#F9E2AF")
         accent = self._palette.get("accent", "#CBA6F7")
+        accent2 = self._palette.get("accent2", "#89B4FA")
         text_muted = self._palette.get("text_muted", "#7A7A9A")
         border = self._palette.get("border", "#313154")
 
-        self.setStyleSheet(
-            "UnlockPopup {"
-            f"  background-color: {_hex_to_rgba(bg, 230)};"
-            f"  border: 2px solid {_hex_to_rgba(warning, 150)};"
-            "  border-radius: 14px;"
-            "}"
-        )
+        # Name colour by unlock type — built once per palette
+        self._name_styles: dict[str, str] = {
+            unlock_type: (
+                f"font-size: 18px; font-weight: 700; color: {color};"
+                "background: transparent; border: none;"
+            )
+            for unlock_type, color in (
+                ("theme", accent),
+                ("companion", accent2),
+                ("title", warning),
+            )
+        }
+
+        # Card fill/border for paintEvent
+        fill = QColor(bg)
+        fill.setAlpha(230)
+        edge = QColor(warning)
+        edge.setAlpha(150)
+        self._card_brush = QBrush(fill)
+        self._card_pen = QPen(edge, self.CARD_BORDER)
+
         self._header.setStyleSheet(
             f"font-size: 20px; font-weight: 700; color: {warning};"
             "background: transparent; border: none;"
             "letter-spacing: 2px;"
         )
-        self._name_label.setStyleSheet(
-            f"font-size: 18px; font-weight: 700; color: {accent};"
-            "background: transparent; border: none;"
-        )
+        self._set_name_style(self._name_styles["theme"])
         self._desc_label.setStyleSheet(
             f"font-size: 12px; color: {text_muted};"
             "background: transparent; border: none;"
@@ -131,36 +173,53 @@ class UnlockPopup(QWidget):
             "padding-top: 4px;"
         )
 
+    def _set_name_style(self, qss: str) -> None:
+        """Apply *qss* to the name label unless it is already set."""
+        if qss != self._name_label.styleSheet():
+            self._name_label.setStyleSheet(qss)
+
     def apply_palette(self, palette: dict[str, str]) -> None:
         """Update colours to match the active theme."""
         self._palette = palette
+        self._layout_sig = None  # restyled labels may measure differently
         self._apply_styles()
+        self._update_sparkle_colors()
+
+    def _update_sparkle_colors(self) -> None:
+        """Precompute the RGBA sparkle table (variations of ``warning``)."""
+        warning = self._palette.get("warning", "#F9E2AF")
+        sparkle_colors = [
+            warning,
+            _lighten(warning, 0.3),
+            _lighten(warning, 0.5),
+            _lighten(warning, 0.15),
+        ]
+        self._sparkle_table = np.array(
+            [QColor(c).getRgb() for c in sparkle_colors], dtype=np.uint8,
+        )
 
     # ── public API ─────────────────────────────────────────────────────
 
     def show_unlock(self, item: UnlockableItem) -> None:
         """Display the unlock celebration for *item*."""
-        accent = self._palette.get("accent", "#CBA6F7")
-        accent2 = self._palette.get("accent2", "#89B4FA")
-        warning = self._palette.get("warning", "#F9E2AF")
-
         self._name_label.setText(item.name)
         self._desc_label.setText(item.preview_description)
 
         # Colour the name by type
-        type_colors = {
-            "theme":     accent,
-            "companion": accent2,
-            "title":     warning,
-        }
-        color = type_colors.get(item.unlock_type, accent)
-        self._name_label.setStyleSheet(
-            f"font-size: 18px; font-weight: 700; color: {color};"
-            "background: transparent; border: none;"
+        self._set_name_style(
+            self._name_styles.get(item.unlock_type, self._name_styles["theme"])
         )
 
-        self.adjustSize()
-        self._position()
+        # Same text in the same parent lays out identically — skip the solve
+        parent = self.parent()
+        sig = (
+            item.name, item.preview_description, item.unlock_type,
+            parent.size() if parent is not None else None,
+        )
+        if sig != self._layout_sig:
+            self._layout_sig = sig
+            self.adjustSize()
+            self._position()
         self.show()
         self.raise_()
 
@@ -170,16 +229,12 @@ class UnlockPopup(QWidget):
             self._particle_timer.start()
 
         # Fade in
-        self._fade_anim.stop()
-        try:
-            self._fade_anim.finished.disconnect()
-        except TypeError:
-            pass
-        self._fade_anim.setDuration(self.FADE_IN_MS)
-        self._fade_anim.setStartValue(0.0)
-        self._fade_anim.setEndValue(1.0)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._fade_anim.start()
+        anim = self._reset_fade_anim()
+        anim.setDuration(self.FADE_IN_MS)
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        anim.start()
 
         self._dismiss_timer.start(self.DISPLAY_MS)
 
@@ -191,75 +246,169 @@ class UnlockPopup(QWidget):
 
     # ── particles ──────────────────────────────────────────────────────
 
+    def _clear_particles(self) -> None:
+        empty = np.empty(0, dtype=np.float32)
+        self._px = empty
+        self._py = empty
+        self._vx = empty
+        self._vy = empty
+        self._life = empty
+        self._size = empty
+        self._colors = np.empty((0, 4), dtype=np.uint8)
+
     def _spawn_particles(self) -> None:
-        warning = self._palette.get("warning", "#F9E2AF")
-        # Generate sparkle colours as variations of the palette warning colour
-        sparkle_colors = [
-            warning,
-            _lighten(warning, 0.3),
-            _lighten(warning, 0.5),
-            _lighten(warning, 0.15),
-        ]
-        self._particles.clear()
+        table = self._sparkle_table
+        n = self.PARTICLE_COUNT
         w, h = self.width(), self.height()
-        for _ in range(20):
-            self._particles.append({
-                "x": random.uniform(10, w - 10),
-                "y": random.uniform(10, h - 10),
-                "vx": random.uniform(-1.5, 1.5),
-                "vy": random.uniform(-2.5, -0.5),
-                "life": 1.0,
-                "color": QColor(random.choice(sparkle_colors)),
-                "size": random.uniform(2, 5),
-            })
+        # One float32 draw for x, y, vx, vy, size — scaled row-wise below
+        lo = np.array([10, 10, -1.5, -2.5, 2], dtype=np.float32)
+        hi = np.array([w - 10, h - 10, 1.5, -0.5, 5], dtype=np.float32)
+        draw = self._rng.random((5, n), dtype=np.float32)
+        draw *= (hi - lo)[:, None]
+        draw += lo[:, None]
+        self._px, self._py, self._vx, self._vy, self._size = draw
+        self._life = np.ones(n, dtype=np.float32)
+        self._colors = table[self._rng.integers(0, len(table), n)]
+        self._particle_rect = self._particle_bounds()
+        self._particle_clock.start()
+
+    def _particle_bounds(self) -> QRect:
+        """Bounding rect of the live particles, padded by their radius."""
+        if not len(self._life):
+            return QRect()
+        m = self.PARTICLE_MARGIN
+        x0 = int(self._px.min()) - m
+        y0 = int(self._py.min()) - m
+        x1 = int(self._px.max()) + m
+        y1 = int(self._py.max()) + m
+        return QRect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
 
     def _tick_particles(self) -> None:
-        alive: list[dict] = []
-        for p in self._particles:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            p["vy"] += 0.06
-            p["life"] -= 0.02
-            if p["life"] > 0:
-                alive.append(p)
-        self._particles = alive
-        if not self._particles and not self.isVisible():
+        dt = min(self._particle_clock.restart() / 1000, self.PARTICLE_MAX_DT_S)
+        alive = _step_particles(
+            self._px, self._py, self._vx, self._vy, self._life,
+            np.float32(dt / self.PARTICLE_STEP_S),
+        )
+        if not alive.all():
+            self._px = self._px[alive]
+            self._py = self._py[alive]
+            self._vx = self._vx[alive]
+            self._vy = self._vy[alive]
+            self._life = self._life[alive]
+            self._size = self._size[alive]
+            self._colors = self._colors[alive]
+        if not len(self._life):
+            # All sparkles spent — stop waking up; erase the last frame once
             self._particle_timer.stop()
-        self.update()
+            if not self._particle_rect.isNull():
+                self.update(self._particle_rect)
+                self._particle_rect = QRect()
+            return
+
+        # Repaint only where sparkles were and are — labels stay untouched
+        bounds = self._particle_bounds()
+        dirty = self._particle_rect.united(bounds)
+        self._particle_rect = bounds
+        if not dirty.isNull():
+            self.update(dirty)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        inset = self.CARD_BORDER / 2
+        path = QPainterPath()
+        path.addRoundedRect(
+            QRectF(self.rect()).adjusted(inset, inset, -inset, -inset),
+            self.CARD_RADIUS, self.CARD_RADIUS,
+        )
+        self._card_path = path
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
-        super().paintEvent(event)
-        if not self._particles:
+        # Fully faded out — nothing drawn here would survive the effect
+        if self._opacity.opacity() * 255 < 1:
             return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        for p in self._particles:
-            c = QColor(p["color"])
-            c.setAlpha(int(255 * max(0, p["life"])))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(c)
-            s = p["size"] * p["life"]
-            painter.drawEllipse(QPointF(p["x"], p["y"]), s, s)
+        painter.setPen(self._card_pen)
+        painter.setBrush(self._card_brush)
+        painter.drawPath(self._card_path)
+        self._paint_particles(painter, event.rect())
         painter.end()
 
+    def _paint_particles(self, painter: QPainter, rect: QRect) -> None:
+        if not len(self._life):
+            return
+        # Skip particles entirely outside the exposed region
+        radius = self._size * self._life
+        visible = np.nonzero(
+            (self._px + radius >= rect.left())
+            & (self._px - radius <= rect.right())
+            & (self._py + radius >= rect.top())
+            & (self._py - radius <= rect.bottom())
+        )[0]
+        if not len(visible):
+            return
+        # Group by final RGBA: one brush change per colour.  Each sparkle is
+        # still its own ellipse so overlapping translucent ones build up.
+        rgb = self._colors[visible, :3].astype(np.uint32)
+        alpha = (255 * self._life[visible]).astype(np.uint32)
+        keys = (rgb[:, 0] << 24) | (rgb[:, 1] << 16) | (rgb[:, 2] << 8) | alpha
+        px = self._px[visible]
+        py = self._py[visible]
+        radius = radius[visible]
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        c = self._scratch_color
+        for key in np.unique(keys).tolist():
+            group = keys == key
+            c.setRgb(key >> 24, (key >> 16) & 0xFF, (key >> 8) & 0xFF, key & 0xFF)
+            painter.setBrush(c)
+            for x, y, r in zip(
+                px[group].tolist(), py[group].tolist(), radius[group].tolist(),
+            ):
+                painter.drawEllipse(QPointF(x, y), r, r)
+
     # ── fade ───────────────────────────────────────────────────────────
 
+    def _reset_fade_anim(self) -> QPropertyAnimation:
+        """Stop the (lazily created) fade; its slots are connected once."""
+        if self._fade_anim is None:
+            self._fade_anim = QPropertyAnimation(
+                self._opacity, b"opacity", self,
+            )
+            self._fade_anim.valueChanged.connect(self._on_fade_value)
+            self._fade_anim.finished.connect(self._on_fade_finished)
+        anim = self._fade_anim
+        anim.stop()
+        self._fading_out = False
+        return anim
+
     def _fade_out(self) -> None:
-        self._fade_anim.stop()
-        try:
-            self._fade_anim.finished.disconnect()
-        except TypeError:
-            pass
-        self._fade_anim.setDuration(self.FADE_OUT_MS)
-        self._fade_anim.setStartValue(1.0)
-        self._fade_anim.setEndValue(0.0)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.InCubic)
-        self._fade_anim.finished.connect(self._on_fade_done)
-        self._fade_anim.start()
+        anim = self._reset_fade_anim()
+        anim.setDuration(self.FADE_OUT_MS)
+        anim.setStartValue(1.0)
+        anim.setEndValue(0.0)
+        anim.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._fading_out = True
+        anim.start()
+
+    def _on_fade_value(self, value: object) -> None:
+        """Stop stepping sparkles once a fade-out becomes invisible."""
+        if (
+            self._fading_out
+            and float(value) * 255 < 1
+            and self._particle_timer.isActive()
+        ):
+            self._particle_timer.stop()
+
+    def _on_fade_finished(self) -> None:
+        """Single ``finished`` slot; only a completed fade-out hides."""
+        if self._fading_out:
+            self._on_fade_done()
 
     def _on_fade_done(self) -> None:
         self.hide()
-        self._particles.clear()
+        self._clear_particles()
+        self._particle_rect = QRect()
         self._particle_timer.stop()
 
     def _position(self) -> None:
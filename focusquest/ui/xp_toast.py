@@ -11,17 +11,48 @@ Usage::
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import (
+    Qt, QEvent, QObject, QTimer, QAbstractAnimation, QPropertyAnimation,
+    QEasingCurve,
+)
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QGraphicsOpacityEffect,
 )
 
+from .styles import hex_to_rgba
+
+
+# Both looks in one sheet, keyed on the toast's ``variant`` property;
+# filled from XPToast._qss_values once per palette.
+_LABEL_RESET = " background: transparent; border: none;"
+_TOAST_QSS = (
+    'XPToast[variant="xp"] {{'
+    "  background-color: {bg_200}; border: 1px solid {success_80};"
+    "  border-radius: 12px;"
+    "}}"
+    'XPToast[variant="levelup"] {{'
+    "  background-color: {bg_220}; border: 1px solid {accent_120};"
+    "  border-radius: 12px;"
+    "}}"
+    'XPToast[variant="xp"] QLabel#xpAmount {{'
+    "  font-size: 24px; font-weight: 700; color: {success};" + _LABEL_RESET +
+    "}}"
+    'XPToast[variant="xp"] QLabel#xpBonus {{'
+    "  font-size: 11px; color: {muted};" + _LABEL_RESET +
+    "}}"
+    'XPToast[variant="levelup"] QLabel#xpAmount {{'
+    "  font-size: 26px; font-weight: 700; color: {accent};" + _LABEL_RESET +
+    "}}"
+    'XPToast[variant="levelup"] QLabel#xpBonus {{'
+    "  font-size: 13px; color: {accent2}; font-weight: 600;" + _LABEL_RESET +
+    "}}"
+)
+
 
-def _hex_to_rgba(hex_color: str, alpha: int) -> str:
-    """Convert '#RRGGBB' + 0-255 alpha to 'rgba(R, G, B, A)'."""
-    h = hex_color.lstrip("#")
-    r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    return f"rgba({r}, {g}, {b}, {alpha})"
+def _set_text(label: QLabel, text: str) -> None:
+    """Set *label*'s text unless unchanged (avoids a layout invalidation)."""
+    if text != label.text():
+        label.setText(text)
 
 
 class XPToast(QWidget):
@@ -30,6 +61,7 @@ class XPToast(QWidget):
     DISPLAY_MS = 2800
     FADE_IN_MS = 300
     FADE_OUT_MS = 900
+    BONUS_SEP = "  \u00b7  "
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -39,20 +71,48 @@ class XPToast(QWidget):
 
         # Palette (populated by apply_palette, falls back to Midnight)
         self._palette: dict[str, str] = {}
+        self._variant: str | None = None
+        self._resolve_palette()
+
+        # Award on screen, and awards queued to merge into it (see show_award)
+        self._shown: tuple[int, list[dict]] | None = None
+        self._pending: list[tuple[int, list[dict]]] = []
+        self._flush_scheduled = False
+
+        # Geometry caches — x only moves when the parent is resized
+        self._cached_x: int | None = None
+        self._layout_sig: tuple | None = None
+        if parent is not None:
+            parent.installEventFilter(self)
 
         self._build_ui()
 
-        # Opacity effect for fade
+        # Fade machinery — many runs never show a toast, so it is built
+        # by _ensure_animation on first use.
+        self._opacity: QGraphicsOpacityEffect | None = None
+        self._fade_anim: QPropertyAnimation | None = None
+        self._fade_state: str | None = None  # "in" / "out" while running
+
+        self._dismiss_timer = QTimer(self)
+        self._dismiss_timer.setSingleShot(True)
+        self._dismiss_timer.timeout.connect(self._start_fade_out)
+
+    def _ensure_animation(self) -> None:
+        """Create the opacity effect, fade animation and curves once."""
+        if self._fade_anim is not None:
+            return
         self._opacity = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(self._opacity)
         self._opacity.setOpacity(0.0)
 
         self._fade_anim = QPropertyAnimation(self._opacity, b"opacity", self)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        self._dismiss_timer = QTimer(self)
-        self._dismiss_timer.setSingleShot(True)
-        self._dismiss_timer.timeout.connect(self._fade_out)
+        self._in_curve = QEasingCurve(QEasingCurve.Type.OutCubic)
+        self._out_curve = QEasingCurve(QEasingCurve.Type.InCubic)
+        self._fade_anim.setEasingCurve(self._in_curve)
+        self._fade_anim.finished.connect(self._on_fade_finished)
+        # (duration, start, end, curve) per direction
+        self._fade_in_cfg = (self.FADE_IN_MS, 0.0, 1.0, self._in_curve)
+        self._fade_out_cfg = (self.FADE_OUT_MS, 1.0, 0.0, self._out_curve)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -61,66 +121,73 @@ class XPToast(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self._amount_label = QLabel("+100 XP", self)
+        self._amount_label.setObjectName("xpAmount")
         self._amount_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._amount_label)
 
         self._bonus_label = QLabel("", self)
+        self._bonus_label.setObjectName("xpBonus")
         self._bonus_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._bonus_label.setWordWrap(True)
         layout.addWidget(self._bonus_label)
 
         # Apply default styles
+        self.setStyleSheet(self._build_qss())
         self._apply_xp_styles()
 
     # ── theming ───────────────────────────────────────────────────────────
 
+    def _resolve_palette(self) -> None:
+        """Resolve the palette into the values ``_TOAST_QSS`` needs."""
+        get = self._palette.get
+        bg = get("bg_secondary", "#232340")
+        success = get("success", "#A6E3A1")
+        accent = get("accent", "#CBA6F7")
+        self._qss_values = {
+            "bg_200": hex_to_rgba(bg, 200),
+            "bg_220": hex_to_rgba(bg, 220),
+            "success": success,
+            "success_80": hex_to_rgba(success, 80),
+            "muted": get("text_muted", "#7A7A9A"),
+            "accent": accent,
+            "accent_120": hex_to_rgba(accent, 120),
+            "accent2": get("accent2", "#89B4FA"),
+        }
+
+    def _build_qss(self) -> str:
+        """One sheet holding both looks, selected by the ``variant`` property."""
+        return _TOAST_QSS.format_map(self._qss_values)
+
+    def _apply_variant(self, variant: str) -> None:
+        """Switch to *variant*'s look; a no-op if already applied.
+
+        Only the ``variant`` property changes — the sheet is set once per
+        palette.  Qt does not re-match property selectors by itself, so
+        the toast and its labels are re-polished explicitly.
+        """
+        if variant == self._variant:
+            return
+        self.setProperty("variant", variant)
+        style = self.style()
+        for widget in (self, self._amount_label, self._bonus_label):
+            style.unpolish(widget)
+            style.polish(widget)
+        self._variant = variant
+
     def _apply_xp_styles(self) -> None:
         """Apply the normal +XP appearance from the current palette."""
-        bg = self._palette.get("bg_secondary", "#232340")
-        success = self._palette.get("success", "#A6E3A1")
-        text_muted = self._palette.get("text_muted", "#7A7A9A")
-
-        self.setStyleSheet(
-            "XPToast {"
-            f"  background-color: {_hex_to_rgba(bg, 200)};"
-            f"  border: 1px solid {_hex_to_rgba(success, 80)};"
-            "  border-radius: 12px;"
-            "}"
-        )
-        self._amount_label.setStyleSheet(
-            f"font-size: 24px; font-weight: 700; color: {success};"
-            "background: transparent; border: none;"
-        )
-        self._bonus_label.setStyleSheet(
-            f"font-size: 11px; color: {text_muted};"
-            "background: transparent; border: none;"
-        )
+        self._apply_variant("xp")
 
     def _apply_levelup_styles(self) -> None:
         """Apply the LEVEL UP! appearance from the current palette."""
-        bg = self._palette.get("bg_secondary", "#232340")
-        accent = self._palette.get("accent", "#CBA6F7")
-        accent2 = self._palette.get("accent2", "#89B4FA")
-
-        self.setStyleSheet(
-            "XPToast {"
-            f"  background-color: {_hex_to_rgba(bg, 220)};"
-            f"  border: 1px solid {_hex_to_rgba(accent, 120)};"
-            "  border-radius: 12px;"
-            "}"
-        )
-        self._amount_label.setStyleSheet(
-            f"font-size: 26px; font-weight: 700; color: {accent};"
-            "background: transparent; border: none;"
-        )
-        self._bonus_label.setStyleSheet(
-            f"font-size: 13px; color: {accent2}; font-weight: 600;"
-            "background: transparent; border: none;"
-        )
+        self._apply_variant("levelup")
 
     def apply_palette(self, palette: dict[str, str]) -> None:
         """Update colours to match the active theme."""
         self._palette = palette
+        self._resolve_palette()
+        self.setStyleSheet(self._build_qss())
+        self._variant = None  # force a re-polish against the new sheet
         # Re-apply whichever style variant is currently showing.
         # If the toast is hidden it will be re-styled by show_award/show_level_up
         # anyway, so just apply the default XP styles.
@@ -129,87 +196,144 @@ class XPToast(QWidget):
     # ── public API ───────────────────────────────────────────────────────
 
     def show_award(self, amount: int, bonuses: list[dict]) -> None:
-        """Display the toast with XP amount and bonus breakdown."""
+        """Display the toast with XP amount and bonus breakdown.
+
+        The first award shows immediately.  Further awards while an award
+        toast is still up are queued and merged into it on the next
+        event-loop turn, so a burst re-lays the toast out only once.
+        """
+        if self._shown is None:
+            self._show_award_now(amount, bonuses)
+            return
+        self._pending.append((amount, bonuses))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_awards)
+
+    def _flush_awards(self) -> None:
+        """Merge the queued awards into the one on screen and re-show."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        awards = [self._shown, *self._pending] if self._shown else self._pending
+        amount = 0
+        merged: dict[str, int] = {}
+        for award_amount, bonuses in awards:
+            amount += award_amount
+            for b in bonuses:
+                merged[b["name"]] = merged.get(b["name"], 0) + b["amount"]
+        self._pending.clear()
+        self._show_award_now(
+            amount, [{"name": n, "amount": a} for n, a in merged.items()],
+        )
+
+    def _show_award_now(self, amount: int, bonuses: list[dict]) -> None:
+        self._shown = (amount, bonuses)
         self._apply_xp_styles()
-        self._amount_label.setText(f"+{amount} XP")
+        _set_text(self._amount_label, f"+{amount} XP")
 
         # Build bonus text from breakdown
         if len(bonuses) > 1:
-            parts = [f"{b['name']} +{b['amount']}" for b in bonuses]
-            self._bonus_label.setText("  \u00b7  ".join(parts))
+            _set_text(self._bonus_label, self.BONUS_SEP.join(
+                [f"{b['name']} +{b['amount']}" for b in bonuses]
+            ))
             self._bonus_label.show()
         else:
             self._bonus_label.hide()
 
-        self.adjustSize()
-        self._position()
+        self._relayout()
         self.show()
         self.raise_()
 
-        # Fade in
-        self._fade_anim.stop()
-        try:
-            self._fade_anim.finished.disconnect()
-        except TypeError:
-            pass
-        self._fade_anim.setDuration(self.FADE_IN_MS)
-        self._fade_anim.setStartValue(0.0)
-        self._fade_anim.setEndValue(1.0)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._fade_anim.start()
+        self._start_fade_in()
 
         # Schedule fade out
         self._dismiss_timer.start(self.DISPLAY_MS)
 
     def show_level_up(self, new_level: int, title: str) -> None:
         """Show a special level-up toast."""
+        # Keep ordering: a queued award shows first, then this replaces it
+        self._flush_awards()
+        self._shown = None
         self._apply_levelup_styles()
-        self._amount_label.setText(f"LEVEL {new_level}!")
-        self._bonus_label.setText(title)
+        _set_text(self._amount_label, f"LEVEL {new_level}!")
+        _set_text(self._bonus_label, title)
         self._bonus_label.show()
 
-        self.adjustSize()
-        self._position()
+        self._relayout()
         self.show()
         self.raise_()
 
-        # Fade in
-        self._fade_anim.stop()
-        try:
-            self._fade_anim.finished.disconnect()
-        except TypeError:
-            pass
-        self._fade_anim.setDuration(self.FADE_IN_MS)
-        self._fade_anim.setStartValue(0.0)
-        self._fade_anim.setEndValue(1.0)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._fade_anim.start()
+        self._start_fade_in()
 
         # Hold longer for level-up
         self._dismiss_timer.start(self.DISPLAY_MS + 1000)
 
     # ── internal ─────────────────────────────────────────────────────────
 
-    def _fade_out(self) -> None:
-        self._fade_anim.stop()
-        try:
-            self._fade_anim.finished.disconnect()
-        except TypeError:
-            pass
-        self._fade_anim.setDuration(self.FADE_OUT_MS)
-        self._fade_anim.setStartValue(1.0)
-        self._fade_anim.setEndValue(0.0)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.InCubic)
-        self._fade_anim.finished.connect(self._on_fade_out_done)
-        self._fade_anim.start()
+    def _stop_fade(self) -> None:
+        self._ensure_animation()
+        if self._fade_anim.state() != QAbstractAnimation.State.Stopped:
+            self._fade_anim.stop()
+        # Fading needs the effect; it is switched off while fully opaque
+        self._opacity.setEnabled(True)
+
+    def _run_fade(self, state: str, cfg: tuple) -> None:
+        """Restart the shared animation with a precomputed fade config."""
+        self._fade_state = state
+        duration, start, end, curve = cfg
+        anim = self._fade_anim
+        anim.setDuration(duration)
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.setEasingCurve(curve)
+        anim.start()
+
+    def _start_fade_in(self) -> None:
+        self._stop_fade()
+        self._run_fade("in", self._fade_in_cfg)
+
+    def _start_fade_out(self) -> None:
+        self._stop_fade()
+        self._run_fade("out", self._fade_out_cfg)
+
+    def _on_fade_finished(self) -> None:
+        """Single ``finished`` slot; only a completed fade-out hides."""
+        if self._fade_state == "out":
+            self._on_fade_out_done()
+        else:
+            # Fully opaque for the hold — paint directly instead of through
+            # the effect's offscreen pixmap
+            self._opacity.setEnabled(False)
 
     def _on_fade_out_done(self) -> None:
+        self._shown = None
         self.hide()
         self._apply_xp_styles()
 
+    def _relayout(self) -> None:
+        """Resize to fit the labels (only if their content changed) and place."""
+        sig = (
+            self._variant,
+            self._amount_label.text(),
+            self._bonus_label.text(),
+            self._bonus_label.isVisibleTo(self),
+        )
+        if sig != self._layout_sig:
+            self._layout_sig = sig
+            self.adjustSize()
+        self._position()
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if event.type() == QEvent.Type.Resize and obj is self.parent():
+            self._cached_x = None
+            if self.isVisible():
+                self._position()
+        return super().eventFilter(obj, event)
+
     def _position(self) -> None:
         """Centre horizontally near the top of the parent widget."""
         if self.parent():
-            pw = self.parent().width()
-            x = (pw - self.width()) // 2
-            self.move(x, 60)
+            if self._cached_x is None:
+                self._cached_x = (self.parent().width() - self.width()) // 2
+            self.move(self._cached_x, 60)
@@ -1,27 +1,155 @@
 """Shared pytest fixtures for FocusQuest tests."""
 
+import os
 import sys
+from datetime import datetime
+
 import pytest
 
+# Headless by default — must be set before QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent
+from PyQt6.QtGui import QFontDatabase
 from PyQt6.QtWidgets import QApplication
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 
-from focusquest.database.db import configure_engine, init_db
+from focusquest.database import db as db_module
+from focusquest.database.db import configure_engine, get_session, init_db
+from focusquest.timer import engine as engine_module
 from focusquest.timer.engine import TimerEngine
+from focusquest.gamification.xp import XPEngine
+
+from helpers import reset_db
+
+
+# Created at import so platform-plugin and font discovery happen once,
+# before collection, rather than inside whichever Qt test runs first.
+_app = QApplication.instance() or QApplication(sys.argv)
+QFontDatabase.families()
+
+# One wall-clock reading for the whole run: engine timestamps and streak
+# dates come from here, so "yesterday" set-ups can't straddle midnight.
+_FROZEN_NOW = datetime.now()
 
 
 @pytest.fixture(scope="session")
 def qapp():
     """A single QApplication instance shared across the entire test run."""
-    app = QApplication.instance() or QApplication(sys.argv)
-    yield app
+    yield _app
 
 
 @pytest.fixture(autouse=True)
-def test_db():
-    """Point every test at a fresh in-memory SQLite database."""
+def flush_deferred_deletes():
+    """Destroy widgets queued with ``deleteLater()`` after each test.
+
+    No event loop runs under pytest, so without this they would pile up
+    for the whole session (history rows, companion widgets, shared
+    fixtures' apps).
+    """
+    yield
+    _app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the in-memory SQLite schema once for the whole run.
+
+    ``configure_engine`` pins in-memory URLs to one pooled connection,
+    so the schema outlives individual sessions.  Under pytest-xdist
+    every worker is its own process and so has its own database.
+
+    pysqlite defers ``BEGIN`` until the first write, which leaves a
+    leading ``SAVEPOINT`` as its own transaction.  Take over transaction
+    control so ``test_db`` can nest every test inside a real one.
+
+    The journal of an in-memory database already lives in memory;
+    temp tables and sort spills are kept there too, and the sync level
+    is dropped since there is no file to make durable.
+    """
     configure_engine("sqlite:///:memory:")
+    sql_engine = db_module._get_engine()
+
+    @event.listens_for(sql_engine, "connect")
+    def _configure_connection(dbapi_conn, _record):
+        dbapi_conn.isolation_level = None
+        dbapi_conn.execute("PRAGMA synchronous = OFF")
+        dbapi_conn.execute("PRAGMA temp_store = MEMORY")
+
+    @event.listens_for(sql_engine, "begin")
+    def _explicit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     init_db()
-    yield
+    yield sql_engine
+
+
+@pytest.fixture(autouse=True)
+def test_db(request, monkeypatch):
+    """Run every test inside a transaction that is rolled back afterwards.
+
+    Sessions join it through a SAVEPOINT, so the code under test can
+    commit (or roll back) as usual while the seeded rows come back
+    untouched for the next test.  Yields the test's connection, or
+    ``None`` for tests marked ``no_db``.
+    """
+    if request.node.get_closest_marker("no_db"):
+        yield None
+        return
+    connection = request.getfixturevalue("db_schema").connect()
+    transaction = connection.begin()
+    monkeypatch.setattr(db_module, "_SessionFactory", sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ))
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="class")
+def committed_db(db_schema):
+    """Let a class-scoped fixture commit rows that outlive ``test_db``.
+
+    Class fixtures run outside any test's transaction, so whatever they
+    write is committed for real; the database is wiped and re-seeded
+    when the class finishes.  Tests in the class may rely only on what
+    their class fixture committed — their own writes still go through
+    ``test_db`` and are rolled back after each test.
+    """
+    yield db_schema
+    reset_db()
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the engine's clock to ``_FROZEN_NOW``."""
+    monkeypatch.setattr(engine_module, "_now", lambda: _FROZEN_NOW)
+    return _FROZEN_NOW
+
+
+@pytest.fixture
+def isolated_settings(tmp_path, monkeypatch):
+    """Point settings load/save at a throwaway ``settings.json``.
+
+    Returns the path; the file itself does not exist until written.
+    """
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr("focusquest.settings.SETTINGS_PATH", path)
+    monkeypatch.setattr("focusquest.settings.APP_SUPPORT_DIR", tmp_path)
+    return path
+
+
+@pytest.fixture
+def db_read(test_db):
+    """A session for read-only assertions at the end of a test.
+
+    Query it only once the code under test has finished writing.
+    """
+    with get_session() as session:
+        yield session
 
 
 @pytest.fixture
@@ -40,3 +168,14 @@ def engine_auto(qapp):
 def engine_no_db(qapp):
     """Fresh TimerEngine with DB disabled (pure state-machine tests)."""
     return TimerEngine(parent=None, db_enabled=False, auto_advance=False)
+
+
+@pytest.fixture(scope="class")
+def xp_engine(qapp):
+    """One XPEngine per test class.
+
+    The engine keeps no state of its own (progress lives in the DB, which
+    each test rolls back), so sharing it is safe as long as signal tests
+    connect through ``SignalCollector``'s context manager.
+    """
+    return XPEngine(parent=None)
@@ -1,35 +1,104 @@
 """Shared test helpers for FocusQuest."""
 
-from focusquest.timer.engine import TimerEngine
+from sqlalchemy import update
+
+from focusquest.database.db import get_session
+from focusquest.database.models import Base, UserProgress, USER_PROGRESS_ID
+from focusquest.timer.engine import TimerEngine, ROUNDS_PER_CYCLE
+
+
+def reset_db() -> None:
+    """Empty every table and re-seed the default progress row."""
+    with get_session() as session:
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.add(UserProgress(id=USER_PROGRESS_ID))
+
+
+def set_progress(**fields) -> None:
+    """Overwrite fields on the seeded UserProgress row in one UPDATE."""
+    with get_session() as session:
+        session.execute(update(UserProgress).values(**fields))
+
+
+def force_paint(widget) -> None:
+    """Run *widget*'s paintEvent into an offscreen pixmap.
+
+    Unlike ``repaint()`` this paints hidden widgets too, and never goes
+    through the window system's backing store.
+    """
+    from PyQt6.QtGui import QPixmap
+
+    pixmap = QPixmap(max(1, widget.width()), max(1, widget.height()))
+    widget.render(pixmap)
 
 
 class SignalCollector:
-    """Utility to capture pyqtSignal emissions into a list."""
+    """Utility to count pyqtSignal emissions and keep the latest payload.
+
+    Only the count and the last payload are kept — no test reads the
+    full history, so there is no list to grow.
 
-    def __init__(self):
-        self.items: list = []
+    Either connect it by hand (``signal.connect(c)``) or pass the signal
+    and use it as a context manager, which disconnects on exit::
+
+        with SignalCollector(engine.tick) as c:
+            ...
+    """
+
+    __slots__ = ("count", "last", "_signal")
+
+    def __init__(self, signal=None):
+        self.count = 0
+        self.last = None
+        self._signal = signal
+
+    def __enter__(self):
+        if self._signal is not None:
+            self._signal.connect(self)
+        return self
+
+    def __exit__(self, *exc):
+        if self._signal is not None:
+            self._signal.disconnect(self)
+        return False
 
     def slot(self, *args):
-        self.items.append(args if len(args) > 1 else args[0] if args else None)
+        self.count += 1
+        # Single-argument signals are by far the most common — test it first
+        n = len(args)
+        if n == 1:
+            self.last = args[0]
+        elif n == 0:
+            self.last = None
+        else:
+            self.last = args
 
     def __call__(self, *args):
         self.slot(*args)
 
     def __len__(self):
-        return len(self.items)
-
-    def __getitem__(self, idx):
-        return self.items[idx]
-
-    @property
-    def last(self):
-        return self.items[-1] if self.items else None
+        return self.count
 
     def clear(self):
-        self.items.clear()
+        self.count = 0
+        self.last = None
 
 
 def complete_session(engine: TimerEngine) -> None:
-    """Fast-complete the current session by jumping to the last tick."""
-    engine._remaining = 1
-    engine._on_tick()
+    """Fast-complete the current session by counting down in one step.
+
+    Costs the same whatever the session length, so tests can keep the
+    real default durations.  Emits the same single ``tick`` (and, for
+    breaks, ``break_ending_soon``) a jump past the last second would.
+    """
+    engine._tick_many(engine.remaining)
+
+
+def run_full_cycle(engine: TimerEngine, rounds: int = ROUNDS_PER_CYCLE) -> None:
+    """Start and finish *rounds* work sessions and the break after each."""
+    for _ in range(rounds):
+        engine.start()  # work
+        complete_session(engine)
+        engine.start()  # break
+        complete_session(engine)
@@ -5,9 +5,12 @@ streak calculation across days, extend-timer, micro sessions, skip,
 pause/resume safety, and auto-advance mode.
 """
 
+from datetime import timedelta
+
 import pytest
-from datetime import date, timedelta
+from sqlalchemy import select
 
+from focusquest.database import db as db_module
 from focusquest.database.db import get_session
 from focusquest.database.models import Session as PomSession, UserProgress
 from focusquest.timer.engine import (
@@ -15,7 +18,25 @@ from focusquest.timer.engine import (
     EXTEND_SECONDS, DEFAULT_DURATIONS, ROUNDS_PER_CYCLE,
 )
 
-from helpers import SignalCollector, complete_session
+from helpers import SignalCollector, complete_session, run_full_cycle
+
+_WORK_DUR = DEFAULT_DURATIONS[SessionType.WORK]
+_SESSIONS_BY_ID = select(PomSession).order_by(PomSession.id)
+
+
+@pytest.fixture
+def opened_sessions(monkeypatch) -> list[int]:
+    """One entry per ``get_session()`` call; ``clear()`` it before the
+    step being measured."""
+    opened: list[int] = []
+    real_get_session = db_module.get_session
+
+    def counting_get_session():
+        opened.append(1)
+        return real_get_session()
+
+    monkeypatch.setattr(db_module, "get_session", counting_get_session)
+    return opened
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -28,7 +49,7 @@ class TestStateTransitions:
     def test_initial_state_is_idle(self, engine):
         assert engine.state == TimerState.IDLE
         assert engine.session_type == SessionType.WORK
-        assert engine.remaining == DEFAULT_DURATIONS[SessionType.WORK]
+        assert engine.remaining == _WORK_DUR
 
     def test_start_transitions_to_working(self, engine):
         engine.start()
@@ -67,7 +88,7 @@ class TestStateTransitions:
         engine.reset()
         assert engine.state == TimerState.IDLE
         # Remaining should be reset to full duration
-        assert engine.remaining == DEFAULT_DURATIONS[SessionType.WORK]
+        assert engine.remaining == _WORK_DUR
 
     def test_start_is_noop_when_already_running(self, engine):
         engine.start()
@@ -86,17 +107,17 @@ class TestStateTransitions:
         assert engine.state == TimerState.WORKING
 
     def test_state_changed_signal_fires_on_transitions(self, engine):
-        c = SignalCollector()
-        engine.state_changed.connect(c)
+        events: list = []
+        engine.state_changed.connect(events.append)
 
         engine.start()
-        assert c.last == TimerState.WORKING
+        assert events[-1] == TimerState.WORKING
 
         engine.pause()
-        assert c.last == TimerState.PAUSED
+        assert events[-1] == TimerState.PAUSED
 
         engine.resume()
-        assert c.last == TimerState.WORKING
+        assert events[-1] == TimerState.WORKING
 
     def test_completion_transitions_to_idle(self, engine):
         """With auto_advance=False, completing goes to IDLE."""
@@ -125,33 +146,31 @@ class TestCountdown:
         assert engine.remaining == initial - 1
 
     def test_tick_signal_emits_remaining(self, engine):
-        c = SignalCollector()
-        engine.tick.connect(c)
-
-        engine.start()
-        engine._on_tick()
+        with SignalCollector(engine.tick) as c:
+            engine.start()
+            engine._on_tick()
 
         assert len(c) == 1
         assert c.last == engine.remaining
 
+        engine._on_tick()  # disconnected on exit
+        assert len(c) == 1
+
     def test_percent_complete_at_halfway(self, engine):
         engine.set_duration(SessionType.WORK, 100)
         engine.start()
-        for _ in range(50):
-            engine._on_tick()
-        assert engine.percent_complete == pytest.approx(0.5, abs=0.02)
+        engine._tick_many(50)
+        assert engine.percent_complete == 0.5
 
     def test_percent_starts_at_zero(self, engine):
         engine.start()
-        assert engine.percent_complete == pytest.approx(0.0, abs=0.01)
+        assert engine.percent_complete == 0.0
 
     def test_remaining_never_goes_negative(self, engine):
         engine.set_duration(SessionType.WORK, 60)
         engine.start()
-        for _ in range(80):
-            if engine.state == TimerState.IDLE:
-                break
-            engine._on_tick()
+        engine._tick_many(80)
+        assert engine.state == TimerState.IDLE
         # Should have completed; remaining should be the next session's
         assert engine.remaining >= 0
 
@@ -190,6 +209,12 @@ class TestRoundTracking:
         assert engine.current_round == 1
         assert engine.session_type == SessionType.WORK
 
+    def test_run_full_cycle_returns_to_round_1(self, engine):
+        run_full_cycle(engine)
+        assert engine.current_round == 1
+        assert engine.session_type == SessionType.WORK
+        assert engine.state == TimerState.IDLE
+
     def test_round_stays_during_break(self, engine):
         """Round number doesn't change until the break completes."""
         engine.start()
@@ -205,12 +230,7 @@ class TestRoundTracking:
         assert engine.current_round == 2
 
     def test_round_resets_after_long_break(self, engine):
-        # Fast-forward to round 4
-        for _ in range(3):
-            engine.start()  # work
-            complete_session(engine)
-            engine.start()  # short break
-            complete_session(engine)
+        run_full_cycle(engine, rounds=3)  # fast-forward to round 4
 
         assert engine.current_round == 4
         engine.start()  # round 4 work
@@ -229,58 +249,53 @@ class TestRoundTracking:
 
 class TestDBLogging:
 
-    def test_session_record_created_on_start(self, engine):
+    def test_session_record_created_on_start(self, engine, db_read):
         engine.start()
-        with get_session() as db:
-            sessions = db.query(PomSession).all()
-            assert len(sessions) == 1
-            assert sessions[0].session_type == "work"
-            assert sessions[0].completed is False
+        sessions = db_read.scalars(_SESSIONS_BY_ID).all()
+        assert len(sessions) == 1
+        assert sessions[0].session_type == "work"
+        assert sessions[0].completed is False
 
-    def test_session_marked_complete(self, engine):
+    def test_session_marked_complete(self, engine, db_read):
         engine.start()
         complete_session(engine)
-        with get_session() as db:
-            s = db.query(PomSession).first()
-            assert s.completed is True
-            assert s.end_time is not None
-            assert s.duration_seconds == DEFAULT_DURATIONS[SessionType.WORK]
+        s = db_read.scalars(_SESSIONS_BY_ID).first()
+        assert s.completed is True
+        assert s.end_time is not None
+        assert s.duration_seconds == _WORK_DUR
 
-    def test_task_label_persisted(self, engine):
+    def test_task_label_persisted(self, engine, db_read):
         engine.task_label = "Write tests"
         engine.start()
         complete_session(engine)
-        with get_session() as db:
-            s = db.query(PomSession).first()
-            assert s.task_label == "Write tests"
+        s = db_read.scalars(_SESSIONS_BY_ID).first()
+        assert s.task_label == "Write tests"
 
-    def test_break_session_logged(self, engine):
+    def test_break_session_logged(self, engine, db_read):
         engine.start()
         complete_session(engine)
         engine.start()  # short break
         complete_session(engine)
-        with get_session() as db:
-            sessions = db.query(PomSession).all()
-            assert len(sessions) == 2
-            assert sessions[1].session_type == "short_break"
-            assert sessions[1].completed is True
+        sessions = db_read.scalars(_SESSIONS_BY_ID).all()
+        assert len(sessions) == 2
+        assert sessions[1].session_type == "short_break"
+        assert sessions[1].completed is True
 
-    def test_reset_does_not_complete_session(self, engine):
+    def test_reset_does_not_complete_session(self, engine, db_read):
         engine.start()
         engine.reset()
-        with get_session() as db:
-            s = db.query(PomSession).first()
-            assert s.completed is False
+        s = db_read.scalars(_SESSIONS_BY_ID).first()
+        assert s.completed is False
 
     def test_session_completed_signal_data(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.task_label = "My task"
         engine.start()
         complete_session(engine)
 
-        data = c.last
+        data = events[-1]
         assert data["session_type"] == "work"
         assert data["task_label"] == "My task"
         assert data["round_number"] == 1
@@ -288,25 +303,48 @@ class TestDBLogging:
         assert data["extensions"] == 0
         assert data["start_time"] is not None
         assert data["end_time"] is not None
-        assert data["duration_seconds"] == DEFAULT_DURATIONS[SessionType.WORK]
+        assert data["duration_seconds"] == _WORK_DUR
 
-    def test_no_db_writes_when_disabled(self, engine_no_db):
+    def test_no_db_writes_when_disabled(self, engine_no_db, db_read):
         engine_no_db.start()
         complete_session(engine_no_db)
-        with get_session() as db:
-            assert db.query(PomSession).count() == 0
+        assert db_read.query(PomSession).count() == 0
 
-    def test_auto_advance_creates_new_session_record(self, engine_auto):
+    def test_auto_advance_creates_new_session_record(self, engine_auto, db_read):
         engine_auto.start()
         complete_session(engine_auto)
         # Auto-advance should create a second record for the break
+        sessions = db_read.scalars(_SESSIONS_BY_ID).all()
+        assert len(sessions) == 2
+        assert sessions[0].completed is True
+        assert sessions[0].session_type == "work"
+        assert sessions[1].completed is False
+        assert sessions[1].session_type == "short_break"
+
+    def test_streak_and_next_start_share_one_transaction(
+        self, engine_auto, opened_sessions,
+    ):
+        engine_auto.start()
+        opened_sessions.clear()
+        complete_session(engine_auto)
+        # completion UPDATE, then streak + auto-advanced INSERT together
+        assert len(opened_sessions) == 2
         with get_session() as db:
-            sessions = db.query(PomSession).all()
-            assert len(sessions) == 2
-            assert sessions[0].completed is True
-            assert sessions[0].session_type == "work"
-            assert sessions[1].completed is False
-            assert sessions[1].session_type == "short_break"
+            assert db.query(PomSession).count() == 2
+            assert db.query(UserProgress).first().current_streak_days == 1
+
+    def test_same_day_work_skips_streak_transaction(
+        self, engine, opened_sessions,
+    ):
+        engine.start()
+        complete_session(engine)  # work — counts today
+        engine.start()
+        complete_session(engine)  # break
+        engine.start()
+        opened_sessions.clear()
+        complete_session(engine)  # work again, same day
+        # completion UPDATE only — today's streak is already counted
+        assert len(opened_sessions) == 1
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -340,9 +378,22 @@ class TestStreaks:
             p = db.query(UserProgress).first()
             assert p.current_streak_days == 1
 
-    def test_consecutive_days_extend_streak(self, engine):
+    def test_same_day_sessions_emit_streak_once(self, engine):
+        c = SignalCollector()
+        engine.streak_updated.connect(c)
+
+        engine.start()
+        complete_session(engine)
+        engine.start()  # break
+        complete_session(engine)
+        engine.start()  # second work, same day
+        complete_session(engine)
+
+        assert len(c) == 1
+
+    def test_consecutive_days_extend_streak(self, engine, frozen_now):
         """Fake yesterday's session, complete today — streak grows."""
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = frozen_now.date() - timedelta(days=1)
         with get_session() as db:
             p = db.query(UserProgress).first()
             p.last_session_date = yesterday
@@ -358,9 +409,9 @@ class TestStreaks:
         assert current == 6
         assert longest == 6
 
-    def test_gap_breaks_streak(self, engine):
+    def test_gap_breaks_streak(self, engine, frozen_now):
         """A 2+ day gap resets current streak to 1, preserves longest."""
-        three_days_ago = date.today() - timedelta(days=3)
+        three_days_ago = frozen_now.date() - timedelta(days=3)
         with get_session() as db:
             p = db.query(UserProgress).first()
             p.last_session_date = three_days_ago
@@ -379,23 +430,19 @@ class TestStreaks:
         engine.start()
         complete_session(engine)
 
-        c = SignalCollector()
-        engine.streak_updated.connect(c)
-
-        engine.start()  # break
-        complete_session(engine)
+        with SignalCollector(engine.streak_updated) as c:
+            engine.start()  # break
+            complete_session(engine)
         assert len(c) == 0  # no streak signal for breaks
 
     def test_streak_not_emitted_when_db_disabled(self, engine_no_db):
-        c = SignalCollector()
-        engine_no_db.streak_updated.connect(c)
-
-        engine_no_db.start()
-        complete_session(engine_no_db)
+        with SignalCollector(engine_no_db.streak_updated) as c:
+            engine_no_db.start()
+            complete_session(engine_no_db)
         assert len(c) == 0
 
-    def test_longest_streak_updates_when_new_record(self, engine):
-        yesterday = date.today() - timedelta(days=1)
+    def test_longest_streak_updates_when_new_record(self, engine, frozen_now):
+        yesterday = frozen_now.date() - timedelta(days=1)
         with get_session() as db:
             p = db.query(UserProgress).first()
             p.last_session_date = yesterday
@@ -459,9 +506,14 @@ class TestExtendTimer:
         assert engine.remaining == before  # unchanged
 
     def test_extend_noop_during_idle(self, engine):
+        events: list = []
+        engine.tick.connect(events.append)
+
         before = engine.remaining
         engine.extend(300)
         assert engine.remaining == before
+        assert events == []
+        assert engine._extensions == 0
 
     def test_extend_noop_during_paused_break(self, engine):
         engine.start()
@@ -474,38 +526,37 @@ class TestExtendTimer:
         assert engine.remaining == before
 
     def test_extended_duration_in_completed_signal(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.set_duration(SessionType.WORK, 60)
         engine.start()
         engine.extend(300)
         complete_session(engine)
 
-        data = c.last
+        data = events[-1]
         assert data["duration_seconds"] == 360
         assert data["extensions"] == 1
 
     def test_extend_emits_tick(self, engine):
         engine.start()
 
-        c = SignalCollector()
-        engine.tick.connect(c)
+        events: list = []
+        engine.tick.connect(events.append)
 
         engine.extend(300)
-        assert len(c) == 1
+        assert len(events) == 1
 
     def test_percent_recalculates_after_extend(self, engine):
         engine.set_duration(SessionType.WORK, 100)
         engine.start()
-        for _ in range(50):
-            engine._on_tick()
+        engine._tick_many(50)
         # 50 elapsed / 100 total = 50%
-        assert engine.percent_complete == pytest.approx(0.5, abs=0.02)
+        assert engine.percent_complete == 0.5
 
         engine.extend(100)
         # 50 elapsed / 200 total = 25%
-        assert engine.percent_complete == pytest.approx(0.25, abs=0.02)
+        assert engine.percent_complete == 0.25
 
     def test_extended_duration_logged_to_db(self, engine):
         engine.set_duration(SessionType.WORK, 60)
@@ -514,7 +565,7 @@ class TestExtendTimer:
         complete_session(engine)
 
         with get_session() as db:
-            s = db.query(PomSession).first()
+            s = db.scalars(_SESSIONS_BY_ID).first()
             assert s.duration_seconds == 360
 
 
@@ -537,21 +588,21 @@ class TestMicroSession:
         assert engine.remaining == 900
 
     def test_micro_flag_in_completed_signal(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.start_micro(10)
         complete_session(engine)
 
-        assert c.last["was_micro"] is True
+        assert events[-1]["was_micro"] is True
 
     def test_normal_session_not_flagged_micro(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.start()
         complete_session(engine)
-        assert c.last["was_micro"] is False
+        assert events[-1]["was_micro"] is False
 
     def test_micro_counts_toward_round(self, engine):
         """Micro sessions advance the cycle like normal work."""
@@ -564,7 +615,7 @@ class TestMicroSession:
         complete_session(engine)
 
         with get_session() as db:
-            s = db.query(PomSession).first()
+            s = db.scalars(_SESSIONS_BY_ID).first()
             assert s.session_type == "work"
             assert s.completed is True
             assert s.duration_seconds == 600
@@ -594,16 +645,16 @@ class TestMicroSession:
 
     def test_micro_flag_resets_after_next_session(self, engine):
         """After a micro completes, the next session isn't flagged micro."""
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.start_micro(10)
         complete_session(engine)
-        assert c.last["was_micro"] is True
+        assert events[-1]["was_micro"] is True
 
         engine.start()  # short break
         complete_session(engine)
-        assert c.last["was_micro"] is False
+        assert events[-1]["was_micro"] is False
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -641,19 +692,19 @@ class TestSkip:
         assert engine.session_type == SessionType.SHORT_BREAK
 
     def test_skip_emits_state_changed(self, engine):
-        c = SignalCollector()
-        engine.state_changed.connect(c)
+        events: list = []
+        engine.state_changed.connect(events.append)
 
         engine.skip()
-        assert c.last == TimerState.IDLE
+        assert events[-1] == TimerState.IDLE
 
     def test_skip_does_not_emit_session_completed(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+        events: list = []
+        engine.session_completed.connect(events.append)
 
         engine.start()
         engine.skip()
-        assert len(c) == 0
+        assert len(events) == 0
 
     def test_skip_resets_extensions(self, engine):
         engine.start()
@@ -671,8 +722,7 @@ class TestPauseResume:
 
     def test_pause_preserves_remaining_time(self, engine):
         engine.start()
-        for _ in range(10):
-            engine._on_tick()
+        engine._tick_many(10)
         remaining_at_pause = engine.remaining
 
         engine.pause()
@@ -680,8 +730,7 @@ class TestPauseResume:
 
     def test_resume_continues_from_where_we_left_off(self, engine):
         engine.start()
-        for _ in range(10):
-            engine._on_tick()
+        engine._tick_many(10)
         remaining_at_pause = engine.remaining
 
         engine.pause()
@@ -704,7 +753,7 @@ class TestPauseResume:
 
         # All those pauses shouldn't have lost any ticks
         # We did 1 + 5 = 6 ticks total
-        expected = DEFAULT_DURATIONS[SessionType.WORK] - 6
+        expected = _WORK_DUR - 6
         assert engine.remaining == expected
 
     def test_pause_during_break(self, engine):
@@ -8,10 +8,12 @@ Covers:
 - GentleStartWidget
 - Anti-anxiety audit (no negative language)
 - Quit-with-confirm logic
+- XPToast styling
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from datetime import datetime, date, timedelta
@@ -19,11 +21,14 @@ from pathlib import Path
 
 import pytest
 from PyQt6.QtWidgets import QApplication
+from sqlalchemy import insert
 
 from focusquest.settings import Settings, load_settings, save_settings
 from focusquest.timer.engine import TimerEngine, TimerState, SessionType
 from focusquest.database.db import get_session
-from focusquest.database.models import UserProgress, Session as SessionModel
+from focusquest.database.models import Session as SessionModel
+
+from helpers import complete_session, set_progress
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -32,20 +37,20 @@ from focusquest.database.models import UserProgress, Session as SessionModel
 
 
 class TestSettingsNewFields:
-    def test_defaults(self):
-        s = Settings()
-        assert s.window_x is None
-        assert s.window_y is None
-        assert s.window_width == 520
-        assert s.window_height == 800
-        assert s.always_on_top is False
-        assert s.compact_mode is False
-
-    def test_round_trip(self, tmp_path, monkeypatch):
-        path = tmp_path / "settings.json"
-        monkeypatch.setattr("focusquest.settings.SETTINGS_PATH", path)
-        monkeypatch.setattr("focusquest.settings.APP_SUPPORT_DIR", tmp_path)
-
+    @pytest.mark.parametrize("attr,expected", [
+        ("window_x", None),
+        ("window_y", None),
+        ("window_width", 520),
+        ("window_height", 800),
+        ("always_on_top", False),
+        ("compact_mode", False),
+    ])
+    def test_defaults(self, attr, expected):
+        value = getattr(Settings(), attr)
+        assert value == expected
+        assert type(value) is type(expected)
+
+    def test_round_trip(self, isolated_settings):
         original = Settings(
             window_x=100, window_y=200,
             window_width=600, window_height=900,
@@ -60,11 +65,7 @@ class TestSettingsNewFields:
         assert loaded.always_on_top is True
         assert loaded.compact_mode is True
 
-    def test_window_x_none_handled(self, tmp_path, monkeypatch):
-        path = tmp_path / "settings.json"
-        monkeypatch.setattr("focusquest.settings.SETTINGS_PATH", path)
-        monkeypatch.setattr("focusquest.settings.APP_SUPPORT_DIR", tmp_path)
-
+    def test_window_x_none_handled(self, isolated_settings):
         original = Settings(window_x=None, window_y=None)
         save_settings(original)
         loaded = load_settings()
@@ -77,45 +78,58 @@ class TestSettingsNewFields:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
+@pytest.fixture(scope="class")
+def timer_widget(qapp):
+    """One TimerWidget (on a DB-less engine) per test class."""
+    from focusquest.ui.timer_widget import TimerWidget
+    w = TimerWidget(TimerEngine(parent=None, db_enabled=False))
+    yield w
+    w.deleteLater()
+
+
+@pytest.fixture
+def compact_widget(timer_widget):
+    """The shared TimerWidget, switched back out of compact mode after."""
+    yield timer_widget
+    timer_widget.set_compact(False)
+
+
 class TestCompactMode:
-    def test_set_compact_hides_task_input(self):
-        eng = TimerEngine(parent=None, db_enabled=False)
-        from focusquest.ui.timer_widget import TimerWidget
-        w = TimerWidget(eng)
+    def test_set_compact_hides_task_input(self, compact_widget):
+        w = compact_widget
         w.set_compact(True)
         assert not w._task_input.isVisible()
 
-    def test_set_compact_hides_dots(self):
-        eng = TimerEngine(parent=None, db_enabled=False)
-        from focusquest.ui.timer_widget import TimerWidget
-        w = TimerWidget(eng)
+    def test_set_compact_hides_dots(self, compact_widget):
+        w = compact_widget
         w.set_compact(True)
-        for dot in w._dots:
-            assert not dot.isVisible()
+        assert not w._dots.isVisible()
 
-    def test_set_compact_shrinks_ring(self):
-        eng = TimerEngine(parent=None, db_enabled=False)
-        from focusquest.ui.timer_widget import TimerWidget
-        w = TimerWidget(eng)
+    def test_set_compact_shrinks_ring(self, compact_widget):
+        w = compact_widget
         w.set_compact(True)
         assert w._ring.width() == 240
 
-    def test_set_compact_false_restores(self):
-        eng = TimerEngine(parent=None, db_enabled=False)
-        from focusquest.ui.timer_widget import TimerWidget
-        w = TimerWidget(eng)
+    def test_set_compact_false_restores(self, compact_widget):
+        w = compact_widget
         w.set_compact(True)
         w.set_compact(False)
         assert not w._task_input.isHidden()
         assert w._ring.width() == 340
-        for dot in w._dots:
-            assert not dot.isHidden()
+        assert not w._dots.isHidden()
 
-    def test_micro_buttons_hidden_in_compact(self):
-        eng = TimerEngine(parent=None, db_enabled=False)
+    def test_dots_fill_after_work_session(self, qapp):
+        # Advances the engine's cycle, so it gets a widget of its own
         from focusquest.ui.timer_widget import TimerWidget
+        eng = TimerEngine(parent=None, db_enabled=False)
         w = TimerWidget(eng)
+        assert w._dots.filled == 0
+        eng.start()
+        complete_session(eng)
+        assert w._dots.filled == 1
+
+    def test_micro_buttons_hidden_in_compact(self, compact_widget):
+        w = compact_widget
         w.set_compact(True)
         assert not w._micro_10_btn.isVisible()
         assert not w._micro_15_btn.isVisible()
@@ -126,20 +140,32 @@ class TestCompactMode:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
-class TestKeyboardShortcuts:
-    def _make_app(self):
-        from focusquest.app import FocusQuestApp
-        return FocusQuestApp()
+@pytest.fixture(scope="class")
+def focus_app(qapp, committed_db):
+    """One FocusQuestApp per test class — building the full UI is slow."""
+    from focusquest.app import FocusQuestApp
+    # The app installs its QSS on the shared QApplication — put it back
+    stylesheet = qapp.styleSheet()
+    app = FocusQuestApp()
+    yield app
+    app.deleteLater()
+    qapp.setStyleSheet(stylesheet)
 
-    def test_on_space_starts_timer(self):
-        app = self._make_app()
+
+@pytest.fixture
+def app(focus_app):
+    """The class's shared app, put back to an idle timer afterwards."""
+    yield focus_app
+    focus_app._timer_engine.reset()
+
+
+class TestKeyboardShortcuts:
+    def test_on_space_starts_timer(self, app):
         assert app._timer_engine.state == TimerState.IDLE
         app._on_space()
         assert app._timer_engine.state == TimerState.WORKING
 
-    def test_on_space_noop_when_input_focused(self):
-        app = self._make_app()
+    def test_on_space_noop_when_input_focused(self, app):
         app._timer_widget._task_input.setFocus()
         # Simulate hasFocus() returning True
         app._timer_widget._task_input.setFocusPolicy(
@@ -150,21 +176,18 @@ class TestKeyboardShortcuts:
         app._on_space()
         # Timer may or may not start depending on focus — this just checks no crash
 
-    def test_on_escape_resets_running(self):
-        app = self._make_app()
+    def test_on_escape_resets_running(self, app):
         app._timer_engine.start()
         assert app._timer_engine.state == TimerState.WORKING
         app._on_escape()
         assert app._timer_engine.state == TimerState.IDLE
 
-    def test_on_escape_noop_when_idle(self):
-        app = self._make_app()
+    def test_on_escape_noop_when_idle(self, app):
         assert app._timer_engine.state == TimerState.IDLE
         app._on_escape()  # should not crash
         assert app._timer_engine.state == TimerState.IDLE
 
-    def test_cycle_theme_advances(self):
-        app = self._make_app()
+    def test_cycle_theme_advances(self, app):
         initial = app._current_theme_key
         assert initial == "midnight"
         # Only midnight is unlocked at level 1, so cycling should be a no-op
@@ -177,6 +200,25 @@ class TestKeyboardShortcuts:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+def _add_work_sessions(db, *sessions: tuple[datetime, str]) -> None:
+    """Insert completed 25-minute work sessions, given as
+    ``(end_time, label)`` pairs, in one executemany round trip.
+
+    Rolled back after every test by conftest's ``test_db``.
+    """
+    db.execute(insert(SessionModel), [
+        {
+            "start_time": end_time - timedelta(minutes=25),
+            "end_time": end_time,
+            "duration_seconds": 1500,
+            "session_type": "work",
+            "completed": True,
+            "task_label": label,
+        }
+        for end_time, label in sessions
+    ])
+
+
 @pytest.mark.usefixtures("qapp")
 class TestSessionHistory:
     def test_empty_db_shows_empty(self):
@@ -190,15 +232,7 @@ class TestSessionHistory:
         from focusquest.ui.session_history import SessionHistoryWidget
         now = datetime.now()
         with get_session() as db:
-            db.add(SessionModel(
-                start_time=now - timedelta(minutes=25),
-                end_time=now,
-                duration_seconds=1500,
-                session_type="work",
-                completed=True,
-                task_label="Test task",
-            ))
-            db.commit()
+            _add_work_sessions(db, (now, "Test task"))
 
         w = SessionHistoryWidget()
         w.refresh()
@@ -209,15 +243,7 @@ class TestSessionHistory:
         from focusquest.ui.session_history import SessionHistoryWidget
         now = datetime.now()
         with get_session() as db:
-            db.add(SessionModel(
-                start_time=now - timedelta(minutes=25),
-                end_time=now,
-                duration_seconds=1500,
-                session_type="work",
-                completed=True,
-                task_label="My task",
-            ))
-            db.commit()
+            _add_work_sessions(db, (now, "My task"))
 
         w = SessionHistoryWidget()
         w.refresh()
@@ -235,15 +261,7 @@ class TestSessionHistory:
         from focusquest.ui.session_history import SessionHistoryWidget
         yesterday = datetime.now() - timedelta(days=1)
         with get_session() as db:
-            db.add(SessionModel(
-                start_time=yesterday - timedelta(minutes=25),
-                end_time=yesterday,
-                duration_seconds=1500,
-                session_type="work",
-                completed=True,
-                task_label="Yesterday task",
-            ))
-            db.commit()
+            _add_work_sessions(db, (yesterday, "Yesterday task"))
 
         w = SessionHistoryWidget()
         w.refresh()
@@ -255,16 +273,9 @@ class TestSessionHistory:
         from focusquest.ui.session_history import SessionHistoryWidget
         now = datetime.now()
         with get_session() as db:
-            for i in range(8):
-                db.add(SessionModel(
-                    start_time=now - timedelta(minutes=25 * (i + 1)),
-                    end_time=now - timedelta(minutes=25 * i),
-                    duration_seconds=1500,
-                    session_type="work",
-                    completed=True,
-                    task_label=f"Task {i}",
-                ))
-            db.commit()
+            _add_work_sessions(db, *(
+                (now - timedelta(minutes=25 * i), f"Task {i}") for i in range(8)
+            ))
 
         w = SessionHistoryWidget()
         w.refresh()
@@ -283,53 +294,52 @@ class TestGentleStart:
         w = GentleStartWidget()
         assert "Welcome to FocusQuest" in w._greeting.text()
 
-    def test_streak_zero_returning_user(self):
+    @pytest.mark.parametrize("progress,check", [
+        pytest.param(
+            dict(total_xp=100, current_level=2, total_sessions_completed=5,
+                 total_focus_minutes=125, current_streak_days=0,
+                 longest_streak_days=3),
+            lambda w: "Welcome back" in w._greeting.text(),
+            id="zero-streak-returning",
+        ),
+        pytest.param(
+            dict(total_xp=500, current_level=5, total_sessions_completed=30,
+                 total_focus_minutes=750, current_streak_days=10,
+                 longest_streak_days=10),
+            lambda w: (
+                "fire" in w._greeting.text().lower()
+                or "\U0001f525" in w._greeting.text()
+            ),
+            id="high-streak-fire",
+        ),
+        pytest.param(
+            dict(total_xp=200, current_level=3, total_sessions_completed=15,
+                 total_focus_minutes=375, current_streak_days=4,
+                 longest_streak_days=4),
+            lambda w: "4-day streak" in w._streak_msg.text(),
+            id="medium-streak",
+        ),
+        pytest.param(
+            dict(total_xp=1000, current_level=5, total_sessions_completed=50,
+                 total_focus_minutes=1250, current_streak_days=3,
+                 longest_streak_days=7),
+            lambda w: (
+                "50 session" in w._progress_msg.text()
+                and "20h 50m" in w._progress_msg.text()
+            ),
+            id="cumulative-progress",
+        ),
+    ])
+    def test_greeting_for_progress(self, progress, check):
         from focusquest.ui.gentle_start import GentleStartWidget
-        # Update the default UserProgress (seeded by init_db) to returning user
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 100
-            progress.current_level = 2
-            progress.total_sessions_completed = 5
-            progress.total_focus_minutes = 125
-            progress.current_streak_days = 0
-            progress.longest_streak_days = 3
-
+        set_progress(**progress)
         w = GentleStartWidget()
-        assert "Welcome back" in w._greeting.text()
+        assert check(w)
         # Must NOT mention broken/missed/lost
-        full_text = w._greeting.text() + w._streak_msg.text()
-        assert "broke" not in full_text.lower()
-        assert "missed" not in full_text.lower()
-        assert "lost" not in full_text.lower()
-
-    def test_streak_high_shows_fire(self):
-        from focusquest.ui.gentle_start import GentleStartWidget
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 500
-            progress.current_level = 5
-            progress.total_sessions_completed = 30
-            progress.total_focus_minutes = 750
-            progress.current_streak_days = 10
-            progress.longest_streak_days = 10
-
-        w = GentleStartWidget()
-        assert "fire" in w._greeting.text().lower() or "\U0001f525" in w._greeting.text()
-
-    def test_streak_medium(self):
-        from focusquest.ui.gentle_start import GentleStartWidget
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 200
-            progress.current_level = 3
-            progress.total_sessions_completed = 15
-            progress.total_focus_minutes = 375
-            progress.current_streak_days = 4
-            progress.longest_streak_days = 4
-
-        w = GentleStartWidget()
-        assert "4-day streak" in w._streak_msg.text()
+        full_text = (w._greeting.text() + w._streak_msg.text()).lower()
+        assert "broke" not in full_text
+        assert "missed" not in full_text
+        assert "lost" not in full_text
 
     def test_start_requested_signal(self):
         from focusquest.ui.gentle_start import GentleStartWidget
@@ -339,84 +349,219 @@ class TestGentleStart:
         w.start_requested.emit()
         assert len(signals) == 1
 
-    def test_cumulative_progress_shown(self):
-        from focusquest.ui.gentle_start import GentleStartWidget
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 1000
-            progress.current_level = 5
-            progress.total_sessions_completed = 50
-            progress.total_focus_minutes = 1250
-            progress.current_streak_days = 3
-            progress.longest_streak_days = 7
-
-        w = GentleStartWidget()
-        txt = w._progress_msg.text()
-        assert "50 session" in txt
-        assert "20h 50m" in txt
-
 
 # ═══════════════════════════════════════════════════════════════════════
 #  ANTI-ANXIETY AUDIT
 # ═══════════════════════════════════════════════════════════════════════
 
 
+_NEGATIVE_PHRASES = ("missed", "broke your", "lost your", "failed", "don't break")
+
+_NEGATIVE_PATTERNS = re.compile(
+    r"\b(" + "|".join(map(re.escape, _NEGATIVE_PHRASES)) + r")\b",
+    re.IGNORECASE,
+)
+
+_SRC_DIR = Path(__file__).parent.parent / "focusquest"
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_file(path: Path) -> tuple[str, ...]:
+    """Return lines containing negative patterns (each file read once).
+
+    The pattern runs over the whole text; line numbers are only worked
+    out for the rare hit.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except Exception:
+        return ()
+    hits: list[str] = []
+    last_line = 0
+    for m in _NEGATIVE_PATTERNS.finditer(text):
+        line_no = text.count("\n", 0, m.start()) + 1
+        if line_no == last_line:
+            continue  # one report per line
+        last_line = line_no
+        bol = text.rfind("\n", 0, m.start()) + 1
+        eol = text.find("\n", m.end())
+        line = text[bol:eol if eol != -1 else len(text)]
+        # Skip test files (this very test) and comments about the audit
+        if "NEGATIVE_PATTERNS" in line or "anti-anxiety" in line.lower():
+            continue
+        hits.append(f"{path.name}:{line_no}: {line.strip()}")
+    return tuple(hits)
+
+
+@pytest.fixture(scope="session")
+def scanned_ui_files() -> dict[Path, tuple[str, ...]]:
+    """Scan results for every module under focusquest/ui, loaded once."""
+    return {p: _scan_file(p) for p in sorted((_SRC_DIR / "ui").glob("*.py"))}
+
+
 class TestAntiAnxiety:
     """Ensure no negative/guilt-tripping language exists in the codebase."""
 
-    NEGATIVE_PATTERNS = re.compile(
-        r"\b(missed|broke your|lost your|failed|don't break)\b",
-        re.IGNORECASE,
-    )
-
-    def _scan_file(self, path: Path) -> list[str]:
-        """Return lines containing negative patterns."""
-        hits = []
-        try:
-            text = path.read_text(encoding="utf-8")
-            for i, line in enumerate(text.splitlines(), 1):
-                # Skip test files (this very test) and comments about the audit
-                if "NEGATIVE_PATTERNS" in line or "anti-anxiety" in line.lower():
-                    continue
-                if self.NEGATIVE_PATTERNS.search(line):
-                    hits.append(f"{path.name}:{i}: {line.strip()}")
-        except Exception:
-            pass
-        return hits
-
-    def test_no_negative_language_in_ui(self):
-        ui_dir = Path(__file__).parent.parent / "focusquest" / "ui"
-        hits: list[str] = []
-        for py_file in ui_dir.glob("*.py"):
-            hits.extend(self._scan_file(py_file))
+    def test_no_negative_language_in_ui(self, scanned_ui_files):
+        hits = [h for file_hits in scanned_ui_files.values() for h in file_hits]
         assert hits == [], f"Negative language found:\n" + "\n".join(hits)
 
     def test_no_negative_language_in_app(self):
-        app_file = Path(__file__).parent.parent / "focusquest" / "app.py"
-        hits = self._scan_file(app_file)
+        hits = list(_scan_file(_SRC_DIR / "app.py"))
         assert hits == [], f"Negative language found:\n" + "\n".join(hits)
 
+    def test_scan_reports_each_hit_line_once(self, tmp_path):
+        sample = tmp_path / "sample.py"
+        sample.write_text(
+            "ok = 1\n"
+            "msg = 'You missed it and failed'\n"
+            "# anti-anxiety audit: 'missed' is allowed here\n"
+            "tail = 'lost your streak'",
+            encoding="utf-8",
+        )
+        assert _scan_file(sample) == (
+            "sample.py:2: msg = 'You missed it and failed'",
+            "sample.py:4: tail = 'lost your streak'",
+        )
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  QUIT WITH CONFIRM
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
 class TestQuitConfirm:
-    def test_quit_when_idle_no_dialog(self):
+    def test_quit_when_idle_no_dialog(self, app, monkeypatch):
         """When idle, _quit_with_confirm should call _quit_app directly."""
-        from focusquest.app import FocusQuestApp
-        app = self._make_app()
         assert app._timer_engine.state == TimerState.IDLE
 
         # Patch _quit_app to track if it's called
         called: list[bool] = []
-        app._quit_app = lambda: called.append(True)
+        monkeypatch.setattr(app, "_quit_app", lambda: called.append(True))
 
         app._quit_with_confirm()
         assert len(called) == 1
 
-    def _make_app(self):
-        from focusquest.app import FocusQuestApp
-        return FocusQuestApp()
+
+# ═══════════════════════════════════════════════════════════════════════
+#  XP TOAST
+# ═══════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.usefixtures("qapp")
+class TestXPToast:
+    def _make_toast(self):
+        from focusquest.ui.xp_toast import XPToast
+        toast = XPToast()
+        toast.apply_palette({"success": "#00FF00", "accent": "#FF0000"})
+        return toast
+
+    def _amount_color(self, toast) -> str:
+        return toast._amount_label.palette().windowText().color().name()
+
+    def test_variants_follow_palette(self):
+        toast = self._make_toast()
+        toast.show_award(100, [])
+        assert self._amount_color(toast) == "#00ff00"
+        toast.show_level_up(3, "Adept")
+        assert self._amount_color(toast) == "#ff0000"
+
+    def test_variant_switch_skips_set_stylesheet(self):
+        toast = self._make_toast()
+        calls: list[str] = []
+        toast.setStyleSheet = calls.append
+        toast.show_level_up(3, "Adept")
+        toast.show_award(50, [])
+        QApplication.processEvents()
+        assert calls == []
+        assert toast.property("variant") == "xp"
+
+    def test_first_award_shows_synchronously(self):
+        toast = self._make_toast()
+        toast.show_award(100, [])
+        assert toast.isVisible()
+        assert toast._amount_label.text() == "+100 XP"
+
+    def test_rapid_awards_coalesce(self):
+        toast = self._make_toast()
+        toast.show_award(100, [{"name": "Session", "amount": 100}])
+        toast.show_award(70, [
+            {"name": "Session", "amount": 50},
+            {"name": "Streak", "amount": 20},
+        ])
+        QApplication.processEvents()
+        assert toast._amount_label.text() == "+170 XP"
+        assert toast._bonus_label.text() == "Session +150  \u00b7  Streak +20"
+        assert toast._pending == []
+
+    def test_level_up_shows_queued_award_first(self):
+        toast = self._make_toast()
+        toast.show_award(100, [])
+        toast.show_level_up(3, "Adept")
+        QApplication.processEvents()
+        assert toast._amount_label.text() == "LEVEL 3!"
+
+    def test_each_toast_owns_its_dismiss_timer(self):
+        first, second = self._make_toast(), self._make_toast()
+        first.show_level_up(2, "Novice")
+        second.show_level_up(3, "Adept")
+        assert first._dismiss_timer is not second._dismiss_timer
+        assert first._dismiss_timer.parent() is first
+        assert first._fade_state == "in"  # untouched by the second toast
+        assert first._dismiss_timer.isActive()
+
+    def test_opacity_effect_off_while_holding(self):
+        toast = self._make_toast()
+        toast.show_level_up(3, "Adept")
+        assert toast._opacity.isEnabled()
+        toast._fade_anim.setCurrentTime(toast.FADE_IN_MS)  # finish fade-in
+        assert not toast._opacity.isEnabled()
+        toast._start_fade_out()
+        assert toast._opacity.isEnabled()
+
+    def test_animation_built_on_first_show(self):
+        toast = self._make_toast()
+        assert toast._fade_anim is None
+        toast.show_level_up(3, "Adept")
+        assert toast._fade_anim is not None
+        assert toast.graphicsEffect() is toast._opacity
+
+
+# ═══════════════════════════════════════════════════════════════════════
+#  UNLOCK POPUP SPARKLES
+# ═══════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.usefixtures("qapp")
+class TestUnlockPopupSparkles:
+    def _render_overlapping_pair(self):
+        """Paint two same-colour, half-spent sparkles that overlap."""
+        import numpy as np
+        from PyQt6.QtCore import QRect
+        from PyQt6.QtGui import QImage, QPainter
+        from focusquest.ui.unlock_popup import UnlockPopup
+
+        popup = UnlockPopup()
+        popup._px = np.array([20, 26], dtype=np.float32)
+        popup._py = np.array([20, 20], dtype=np.float32)
+        popup._size = np.array([10, 10], dtype=np.float32)  # r = 5 at half life
+        popup._life = np.array([0.5, 0.5], dtype=np.float32)
+        popup._colors = np.array([[255, 0, 0, 255]] * 2, dtype=np.uint8)
+
+        image = QImage(48, 40, QImage.Format.Format_ARGB32)
+        image.fill(0)
+        painter = QPainter(image)
+        popup._paint_particles(painter, QRect(0, 0, 48, 40))
+        painter.end()
+        return image
+
+    def test_overlap_is_painted(self):
+        image = self._render_overlapping_pair()
+        assert image.pixelColor(23, 20).alpha() > 0
+
+    def test_overlapping_translucent_sparkles_build_up(self):
+        image = self._render_overlapping_pair()
+        single = image.pixelColor(17, 20).alpha()  # first sparkle only
+        overlap = image.pixelColor(23, 20).alpha()
+        assert single > 0
+        assert overlap > single
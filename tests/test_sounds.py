@@ -9,14 +9,16 @@ Covers:
 
 from __future__ import annotations
 
+import io
 import json
+import os
 import wave
 from pathlib import Path
 
 import pytest
 from PyQt6.QtWidgets import QApplication
 
-from focusquest.settings import Settings, load_settings, save_settings, SETTINGS_PATH
+from focusquest.settings import Settings, load_settings, save_settings
 from focusquest.audio.sounds import (
     SoundManager,
     _generate_chime,
@@ -35,85 +37,53 @@ from focusquest.timer.engine import TimerEngine, TimerState, SessionType
 # ═══════════════════════════════════════════════════════════════════════
 
 
-class TestSettingsDefaults:
-    def test_work_duration(self):
-        s = Settings()
-        assert s.work_duration == 25 * 60
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
+    return Settings()
 
-    def test_short_break(self):
-        s = Settings()
-        assert s.short_break_duration == 5 * 60
 
-    def test_long_break(self):
-        s = Settings()
-        assert s.long_break_duration == 15 * 60
-
-    def test_rounds_per_cycle(self):
-        s = Settings()
-        assert s.rounds_per_cycle == 4
-
-    def test_sound_enabled(self):
-        s = Settings()
-        assert s.sound_enabled is True
-
-    def test_volume_default(self):
-        s = Settings()
-        assert s.sound_volume == 70
-
-    def test_notifications_default(self):
-        s = Settings()
-        assert s.notifications_enabled is True
-
-    def test_dnd_default(self):
-        s = Settings()
-        assert s.do_not_disturb is False
-
-    def test_minimize_to_tray_default(self):
-        s = Settings()
-        assert s.minimize_to_tray is True
-
-    def test_auto_start_defaults(self):
-        s = Settings()
-        assert s.auto_start_breaks is False
-        assert s.auto_start_work is False
+class TestSettingsDefaults:
+    @pytest.mark.parametrize("attr,expected", [
+        ("work_duration", 25 * 60),
+        ("short_break_duration", 5 * 60),
+        ("long_break_duration", 15 * 60),
+        ("rounds_per_cycle", 4),
+        ("sound_enabled", True),
+        ("sound_volume", 70),
+        ("notifications_enabled", True),
+        ("do_not_disturb", False),
+        ("minimize_to_tray", True),
+        ("auto_start_breaks", False),
+        ("auto_start_work", False),
+    ])
+    def test_default(self, default_settings, attr, expected):
+        value = getattr(default_settings, attr)
+        assert value == expected
+        assert type(value) is type(expected)
 
 
 class TestSettingsPersistence:
-    def test_round_trip(self, tmp_path, monkeypatch):
+    def test_round_trip(self, isolated_settings):
         """save → load produces identical settings."""
-        path = tmp_path / "settings.json"
-        monkeypatch.setattr(
-            "focusquest.settings.SETTINGS_PATH", path,
-        )
-        monkeypatch.setattr(
-            "focusquest.settings.APP_SUPPORT_DIR", tmp_path,
-        )
         original = Settings(work_duration=30 * 60, sound_volume=42)
         save_settings(original)
         loaded = load_settings()
         assert loaded.work_duration == 30 * 60
         assert loaded.sound_volume == 42
 
-    def test_missing_file_returns_defaults(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "focusquest.settings.SETTINGS_PATH",
-            tmp_path / "nonexistent.json",
-        )
+    def test_missing_file_returns_defaults(self, isolated_settings):
+        assert not isolated_settings.exists()
         s = load_settings()
         assert s.work_duration == 25 * 60  # default
 
-    def test_invalid_json_returns_defaults(self, tmp_path, monkeypatch):
-        path = tmp_path / "settings.json"
-        path.write_text("NOT VALID JSON", encoding="utf-8")
-        monkeypatch.setattr("focusquest.settings.SETTINGS_PATH", path)
+    def test_invalid_json_returns_defaults(self, isolated_settings):
+        isolated_settings.write_text("NOT VALID JSON", encoding="utf-8")
         s = load_settings()
         assert s.work_duration == 25 * 60
 
-    def test_extra_keys_ignored(self, tmp_path, monkeypatch):
-        path = tmp_path / "settings.json"
+    def test_extra_keys_ignored(self, isolated_settings):
         data = {"work_duration": 1800, "unknown_future_key": True}
-        path.write_text(json.dumps(data), encoding="utf-8")
-        monkeypatch.setattr("focusquest.settings.SETTINGS_PATH", path)
+        isolated_settings.write_text(json.dumps(data), encoding="utf-8")
         s = load_settings()
         assert s.work_duration == 1800
         assert not hasattr(s, "unknown_future_key")
@@ -124,90 +94,106 @@ class TestSettingsPersistence:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="session", params=[
+    _generate_chime,
+    _generate_achievement,
+    _generate_bell,
+    _generate_double_tap,
+    _generate_fanfare,
+    _generate_click,
+], ids=lambda fn: fn.__name__)
+def wav_bytes(request) -> bytes:
+    """Each generator's output, synthesised once for the whole run."""
+    return request.param()
+
+
+@pytest.fixture(scope="session")
+def parsed_wav(wav_bytes) -> dict[str, int]:
+    """Header fields of each generator's WAV, parsed once."""
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        return {
+            "nchannels": wf.getnchannels(),
+            "sampwidth": wf.getsampwidth(),
+            "framerate": wf.getframerate(),
+            "nframes": wf.getnframes(),
+        }
+
+
 class TestSoundGeneration:
     """Test that each generator produces valid WAV bytes."""
 
-    @pytest.mark.parametrize("gen_fn", [
-        _generate_chime,
-        _generate_achievement,
-        _generate_bell,
-        _generate_double_tap,
-        _generate_fanfare,
-        _generate_click,
-    ])
-    def test_generator_produces_wav(self, gen_fn):
-        data = gen_fn()
-        assert isinstance(data, bytes)
-        assert len(data) > 100  # non-trivial WAV
+    def test_generator_produces_wav(self, wav_bytes):
+        assert isinstance(wav_bytes, bytes)
+        assert len(wav_bytes) > 100  # non-trivial WAV
         # WAV files start with RIFF header
-        assert data[:4] == b"RIFF"
-
-    @pytest.mark.parametrize("gen_fn", [
-        _generate_chime,
-        _generate_achievement,
-        _generate_bell,
-        _generate_double_tap,
-        _generate_fanfare,
-        _generate_click,
-    ])
-    def test_wav_is_parseable(self, gen_fn):
-        import io
-        data = gen_fn()
-        buf = io.BytesIO(data)
-        with wave.open(buf, "rb") as wf:
-            assert wf.getnchannels() == 1
-            assert wf.getsampwidth() == 2
-            assert wf.getframerate() == 44100
-            assert wf.getnframes() > 0
+        assert wav_bytes[:4] == b"RIFF"
+
+    def test_wav_is_parseable(self, parsed_wav):
+        assert parsed_wav["nframes"] > 0
+        assert parsed_wav == {
+            "nchannels": 1,
+            "sampwidth": 2,
+            "framerate": 44100,
+            "nframes": parsed_wav["nframes"],
+        }
+
+
+@pytest.fixture(scope="session")
+def sound_mgr(qapp, tmp_path_factory) -> SoundManager:
+    """One SoundManager (and one set of WAV files) for the whole run."""
+    return SoundManager(parent=None, sounds_dir=tmp_path_factory.mktemp("sounds"))
+
+
+@pytest.fixture
+def mgr(sound_mgr):
+    """The shared SoundManager, back at default volume/enabled afterwards."""
+    yield sound_mgr
+    sound_mgr.set_volume(70)
+    sound_mgr.set_enabled(True)
 
 
-@pytest.mark.usefixtures("qapp")
 class TestSoundManager:
-    def test_create(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
+    def test_create(self, mgr):
         assert mgr.enabled is True
 
-    def test_wav_files_generated(self, tmp_path):
-        SoundManager(parent=None, sounds_dir=tmp_path)
+    def test_wav_files_generated(self, mgr):
+        # One directory listing instead of an exists() + stat() per file
+        with os.scandir(mgr._sounds_dir) as entries:
+            sizes = {e.name: e.stat().st_size for e in entries}
         for name in SOUND_NAMES:
-            path = tmp_path / f"{name}.wav"
-            assert path.exists(), f"Missing WAV: {name}"
-            assert path.stat().st_size > 100
-
-    def test_set_volume(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
-        mgr.set_volume(30)
-        assert mgr.volume == 30
-
-    def test_set_volume_clamps_high(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
-        mgr.set_volume(200)
-        assert mgr.volume == 100
-
-    def test_set_volume_clamps_low(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
-        mgr.set_volume(-10)
-        assert mgr.volume == 0
-
-    def test_set_enabled(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
+            assert f"{name}.wav" in sizes, f"Missing WAV: {name}"
+            assert sizes[f"{name}.wav"] > 100
+
+    @pytest.mark.parametrize("v_in,v_out", [
+        (30, 30),
+        (200, 100),  # clamps high
+        (-10, 0),    # clamps low
+        (0, 0),
+        (100, 100),
+    ])
+    def test_set_volume(self, mgr, v_in, v_out):
+        mgr.set_volume(v_in)
+        assert mgr.volume == v_out
+
+    def test_set_enabled(self, mgr):
         mgr.set_enabled(False)
         assert mgr.enabled is False
 
-    def test_play_invalid_name_no_crash(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
+    def test_play_invalid_name_no_crash(self, mgr):
         mgr.play("nonexistent_sound")  # should not raise
 
-    def test_play_while_disabled_no_crash(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
+    def test_play_while_disabled_no_crash(self, mgr):
         mgr.set_enabled(False)
         mgr.play("click")  # should be a no-op
 
-    def test_all_sounds_loaded(self, tmp_path):
-        mgr = SoundManager(parent=None, sounds_dir=tmp_path)
+    def test_all_sounds_loaded(self, mgr):
         for name in SOUND_NAMES:
             assert name in mgr._effects
 
+    def test_defaults_restored_between_tests(self, mgr):
+        assert mgr.volume == 70
+        assert mgr.enabled is True
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  BREAK-WARNING SIGNAL
@@ -217,14 +203,20 @@ class TestSoundManager:
 class TestBreakWarningSignal:
     """Test that break_ending_soon fires correctly."""
 
-    def test_fires_during_short_break(self, engine_no_db):
-        """break_ending_soon should fire once at 60 s during a short break."""
+    @pytest.mark.parametrize("state,expected_signals", [
+        (TimerState.SHORT_BREAK, 1),
+        (TimerState.LONG_BREAK, 1),
+        (TimerState.WORKING, 0),
+    ])
+    def test_fires_once_at_60s_during_breaks(
+        self, engine_no_db, state, expected_signals,
+    ):
+        """break_ending_soon fires once at 60 s in breaks, never in work."""
         eng = engine_no_db
         signals: list[bool] = []
         eng.break_ending_soon.connect(lambda: signals.append(True))
 
-        # Manually set up a short break with 62 s remaining
-        eng._state = TimerState.SHORT_BREAK
+        eng._state = state
         eng._remaining = 62
 
         # Tick down from 62 → 61 (no fire)
@@ -232,50 +224,39 @@ class TestBreakWarningSignal:
         assert len(signals) == 0
         assert eng._remaining == 61
 
-        # Tick 61 → 60 (fires!)
+        # Tick 61 → 60 (fires in breaks)
         eng._on_tick()
-        assert len(signals) == 1
+        assert len(signals) == expected_signals
         assert eng._remaining == 60
 
         # Tick 60 → 59 (should NOT fire again)
         eng._on_tick()
-        assert len(signals) == 1
+        assert len(signals) == expected_signals
 
-    def test_fires_during_long_break(self, engine_no_db):
+    def test_fires_only_once(self, engine_no_db):
         eng = engine_no_db
         signals: list[bool] = []
         eng.break_ending_soon.connect(lambda: signals.append(True))
 
-        eng._state = TimerState.LONG_BREAK
-        eng._remaining = 61
+        eng._state = TimerState.SHORT_BREAK
+        eng._remaining = 62
 
-        eng._on_tick()  # 61 → 60
+        eng._tick_many(2)  # 62 → 60
         assert len(signals) == 1
+        eng._tick_many(60)  # 60 → 0
+        assert len(signals) == 1  # only once
 
-    def test_does_not_fire_during_work(self, engine_no_db):
-        eng = engine_no_db
-        signals: list[bool] = []
-        eng.break_ending_soon.connect(lambda: signals.append(True))
-
-        eng._state = TimerState.WORKING
-        eng._remaining = 61
-
-        eng._on_tick()  # 61 → 60
-        assert len(signals) == 0
-
-    def test_fires_only_once(self, engine_no_db):
+    def test_bulk_tick_past_60s_fires(self, engine_no_db):
+        """Jumping straight over the 60 s mark still warns."""
         eng = engine_no_db
         signals: list[bool] = []
         eng.break_ending_soon.connect(lambda: signals.append(True))
 
         eng._state = TimerState.SHORT_BREAK
-        eng._remaining = 62
-
-        # Tick through 62 → 0
-        for _ in range(62):
-            eng._on_tick()
+        eng._remaining = 120
 
-        assert len(signals) == 1  # only once
+        eng._tick_many(119)  # 120 → 1
+        assert len(signals) == 1
 
     def test_resets_on_new_session(self, engine_no_db):
         eng = engine_no_db
@@ -13,10 +13,11 @@ from __future__ import annotations
 from datetime import date, datetime, timedelta
 
 import pytest
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QPoint
+from sqlalchemy import insert
 
 from focusquest.database.db import get_session
-from focusquest.database.models import UserProgress, DailyStats, Session
+from focusquest.database.models import DailyStats, Session
 from focusquest.ui.stats_widget import (
     _format_focus_hours,
     _format_hour,
@@ -31,6 +32,8 @@ from focusquest.ui.stats_widget import (
 )
 from focusquest.gamification.unlockables import REGISTRY
 
+from helpers import force_paint, set_progress
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  FORMAT HELPERS
@@ -38,61 +41,69 @@ from focusquest.gamification.unlockables import REGISTRY
 
 
 class TestFormatFocusHours:
-    def test_zero_minutes(self):
-        assert _format_focus_hours(0) == "0m"
-
-    def test_negative_minutes(self):
-        assert _format_focus_hours(-5) == "0m"
-
-    def test_minutes_only(self):
-        assert _format_focus_hours(45) == "45m"
-
-    def test_exact_hour(self):
-        assert _format_focus_hours(60) == "1h 0m"
-
-    def test_hours_and_minutes(self):
-        assert _format_focus_hours(125) == "2h 5m"
-
-    def test_large_value(self):
-        assert _format_focus_hours(600) == "10h 0m"
-
-    def test_one_minute(self):
-        assert _format_focus_hours(1) == "1m"
+    @pytest.mark.parametrize("minutes, expected", [
+        (0, "0m"),
+        (-5, "0m"),
+        (45, "45m"),
+        (60, "1h 0m"),
+        (125, "2h 5m"),
+        (600, "10h 0m"),
+        (1, "1m"),
+    ])
+    def test_format(self, minutes, expected):
+        assert _format_focus_hours(minutes) == expected
 
 
 class TestFormatHour:
-    def test_none(self):
-        assert _format_hour(None) == "\u2014"
+    @pytest.mark.parametrize("hour, expected", [
+        (None, "\u2014"),
+        (0, "12 AM"),
+        (9, "9 AM"),
+        (12, "12 PM"),
+        (14, "2 PM"),
+        (11, "11 AM"),
+        (23, "11 PM"),
+    ])
+    def test_format(self, hour, expected):
+        assert _format_hour(hour) == expected
 
-    def test_midnight(self):
-        assert _format_hour(0) == "12 AM"
 
-    def test_morning(self):
-        assert _format_hour(9) == "9 AM"
+# ═══════════════════════════════════════════════════════════════════════
+#  DATA LOADING
+# ═══════════════════════════════════════════════════════════════════════
 
-    def test_noon(self):
-        assert _format_hour(12) == "12 PM"
 
-    def test_afternoon(self):
-        assert _format_hour(14) == "2 PM"
+def _work_session_row(start_time: datetime) -> dict:
+    """A completed 25-minute work session, as ``insert(Session)`` params."""
+    return {
+        "start_time": start_time,
+        "session_type": "work",
+        "completed": True,
+        "duration_seconds": 1500,
+    }
 
-    def test_eleven_am(self):
-        assert _format_hour(11) == "11 AM"
 
-    def test_eleven_pm(self):
-        assert _format_hour(23) == "11 PM"
+def _daily_row(day: date, *, sessions: int, minutes: int, xp: int) -> dict:
+    """One day's totals, as ``insert(DailyStats)`` params."""
+    return {
+        "date": day,
+        "sessions_completed": sessions,
+        "focus_minutes": minutes,
+        "xp_earned": xp,
+    }
 
 
-# ═══════════════════════════════════════════════════════════════════════
-#  DATA LOADING
-# ═══════════════════════════════════════════════════════════════════════
+@pytest.fixture
+def empty_stats(test_db) -> _StatsCache:
+    """``_load_stats()`` against the freshly seeded database."""
+    return _load_stats()
 
 
 class TestLoadStats:
     """Test _load_stats with various DB states."""
 
-    def test_empty_db_returns_defaults(self):
-        cache = _load_stats()
+    def test_empty_db_returns_defaults(self, empty_stats):
+        cache = empty_stats
         assert cache.level == 1
         assert cache.total_xp == 0
         assert cache.today_sessions == 0
@@ -102,8 +113,8 @@ class TestLoadStats:
         assert cache.favorite_hour is None
         assert cache.avg_sessions_per_day == 0.0
 
-    def test_weekly_has_7_entries(self):
-        cache = _load_stats()
+    def test_weekly_has_7_entries(self, empty_stats):
+        cache = empty_stats
         assert len(cache.weekly) == 7
         # Each entry is (label, value, is_today)
         for label, value, is_today in cache.weekly:
@@ -111,19 +122,19 @@ class TestLoadStats:
             assert isinstance(value, int)
             assert isinstance(is_today, bool)
 
-    def test_weekly_last_entry_is_today(self):
-        cache = _load_stats()
+    def test_weekly_last_entry_is_today(self, empty_stats):
+        cache = empty_stats
         # Last entry should be today
         _, _, is_today = cache.weekly[-1]
         assert is_today is True
 
-    def test_weekly_first_6_are_not_today(self):
-        cache = _load_stats()
+    def test_weekly_first_6_are_not_today(self, empty_stats):
+        cache = empty_stats
         for _, _, is_today in cache.weekly[:6]:
             assert is_today is False
 
-    def test_monthly_has_30_entries(self):
-        cache = _load_stats()
+    def test_monthly_has_30_entries(self, empty_stats):
+        cache = empty_stats
         assert len(cache.monthly) == 30
         # Each entry has required keys
         for entry in cache.monthly:
@@ -132,26 +143,26 @@ class TestLoadStats:
             assert "minutes" in entry
             assert "xp" in entry
 
-    def test_monthly_last_entry_is_today(self):
-        cache = _load_stats()
+    def test_monthly_last_entry_is_today(self, empty_stats):
+        cache = empty_stats
         today = date.today()
         assert cache.monthly[-1]["date"] == today
 
-    def test_monthly_first_entry_is_29_days_ago(self):
-        cache = _load_stats()
+    def test_monthly_first_entry_is_29_days_ago(self, empty_stats):
+        cache = empty_stats
         today = date.today()
         expected = today - timedelta(days=29)
         assert cache.monthly[0]["date"] == expected
 
     def test_with_user_progress(self):
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 500
-            progress.current_level = 3
-            progress.total_sessions_completed = 10
-            progress.total_focus_minutes = 250
-            progress.current_streak_days = 3
-            progress.longest_streak_days = 7
+        set_progress(
+            total_xp=500,
+            current_level=3,
+            total_sessions_completed=10,
+            total_focus_minutes=250,
+            current_streak_days=3,
+            longest_streak_days=7,
+        )
 
         cache = _load_stats()
         assert cache.level == 3
@@ -180,18 +191,10 @@ class TestLoadStats:
         today = date.today()
         yesterday = today - timedelta(days=1)
         with get_session() as db:
-            db.add(DailyStats(
-                date=today,
-                sessions_completed=2,
-                focus_minutes=50,
-                xp_earned=200,
-            ))
-            db.add(DailyStats(
-                date=yesterday,
-                sessions_completed=3,
-                focus_minutes=75,
-                xp_earned=300,
-            ))
+            db.execute(insert(DailyStats), [
+                _daily_row(today, sessions=2, minutes=50, xp=200),
+                _daily_row(yesterday, sessions=3, minutes=75, xp=300),
+            ])
 
         cache = _load_stats()
         # Last entry (today) should have 50 minutes
@@ -201,54 +204,39 @@ class TestLoadStats:
         assert cache.weekly_total_minutes == 125
 
     def test_favorite_hour_with_sessions(self):
+        # Three sessions at 2 PM, one at 9 AM
+        hours = [14, 14, 14, 9]
         with get_session() as db:
-            # Add sessions at different hours
-            for _ in range(3):
-                db.add(Session(
-                    start_time=datetime(2025, 1, 15, 14, 0),
-                    session_type="work",
-                    completed=True,
-                    duration_seconds=1500,
-                ))
-            for _ in range(1):
-                db.add(Session(
-                    start_time=datetime(2025, 1, 15, 9, 0),
-                    session_type="work",
-                    completed=True,
-                    duration_seconds=1500,
-                ))
+            db.execute(insert(Session), [
+                _work_session_row(datetime(2025, 1, 15, hour, 0))
+                for hour in hours
+            ])
 
         cache = _load_stats()
         assert cache.favorite_hour == 14
 
     def test_avg_sessions_per_day(self):
         today = date.today()
+        set_progress(total_sessions_completed=12)
         with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_sessions_completed = 12
             # Add 4 active days
-            for i in range(4):
-                db.add(DailyStats(
-                    date=today - timedelta(days=i),
-                    sessions_completed=3,
-                    focus_minutes=75,
-                    xp_earned=300,
-                ))
+            db.execute(insert(DailyStats), [
+                _daily_row(today - timedelta(days=i),
+                           sessions=3, minutes=75, xp=300)
+                for i in range(4)
+            ])
 
         cache = _load_stats()
         assert cache.avg_sessions_per_day == 3.0  # 12 / 4
 
-    def test_teasers_populated(self):
-        cache = _load_stats()
+    def test_teasers_populated(self, empty_stats):
+        cache = empty_stats
         # At level 1, there should be teasers
         assert len(cache.teasers) > 0
         assert cache.next_unlock is not None
 
     def test_level_progress_values(self):
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 500
-            progress.current_level = 3
+        set_progress(total_xp=500, current_level=3)
 
         cache = _load_stats()
         assert cache.earned_in_level >= 0
@@ -261,38 +249,36 @@ class TestLoadStats:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
-class TestSessionRing:
-    def test_create(self):
-        w = _SessionRing()
-        assert w.width() == 64
-        assert w.height() == 64
+@pytest.fixture(scope="class")
+def ring(qapp):
+    """One _SessionRing per test class; each test sets its own data."""
+    w = _SessionRing()
+    yield w
+    w.deleteLater()
 
-    def test_set_data(self):
-        w = _SessionRing()
-        w.set_data(3, 6)
-        assert w._completed == 3
-        assert w._target == 6
 
-    def test_set_data_zero_target(self):
-        w = _SessionRing()
-        w.set_data(0, 0)
-        assert w._target == 1  # clamped to avoid division by zero
+class TestSessionRing:
+    def test_create(self, ring):
+        assert ring.width() == 64
+        assert ring.height() == 64
 
-    def test_paint_no_crash(self):
-        w = _SessionRing()
-        w.set_data(3, 6)
-        w.repaint()
+    def test_set_data(self, ring):
+        ring.set_data(3, 6)
+        assert ring._completed == 3
+        assert ring._target == 6
 
-    def test_paint_full_ring(self):
-        w = _SessionRing()
-        w.set_data(6, 6)
-        w.repaint()
+    def test_set_data_zero_target(self, ring):
+        ring.set_data(0, 0)
+        assert ring._target == 1  # clamped to avoid division by zero
 
-    def test_paint_over_target(self):
-        w = _SessionRing()
-        w.set_data(10, 6)
-        w.repaint()  # Should not crash (pct clamped to 1.0)
+    @pytest.mark.parametrize(
+        "completed, target",
+        [(3, 6), (6, 6), (10, 6)],  # over target: pct clamped to 1.0
+        ids=["partial", "full", "over_target"],
+    )
+    def test_paint_no_crash(self, ring, completed, target):
+        ring.set_data(completed, target)
+        force_paint(ring)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -300,37 +286,39 @@ class TestSessionRing:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
+@pytest.fixture(scope="class")
+def chart(qapp):
+    """One WeeklyBarChart per test class; each test sets its own data."""
+    w = WeeklyBarChart()
+    yield w
+    w.deleteLater()
+
+
 class TestWeeklyBarChart:
-    def test_create(self):
-        w = WeeklyBarChart()
-        assert w.minimumHeight() == 180
+    def test_create(self, chart):
+        assert chart.minimumHeight() == 180
 
-    def test_set_data_empty(self):
-        w = WeeklyBarChart()
-        w.set_data([])
-        w.repaint()  # No crash
+    def test_set_data_empty(self, chart):
+        chart.set_data([])
+        force_paint(chart)  # No crash
 
-    def test_set_data_normal(self):
+    def test_set_data_normal(self, chart):
         data = [("Mon", 30, False), ("Tue", 45, False), ("Wed", 0, False),
                 ("Thu", 60, False), ("Fri", 25, False), ("Sat", 0, False),
                 ("Sun", 90, True)]
-        w = WeeklyBarChart()
-        w.set_data(data)
-        w.repaint()
+        chart.set_data(data)
+        force_paint(chart)
 
-    def test_set_data_all_zeros(self):
+    def test_set_data_all_zeros(self, chart):
         data = [(d, 0, d == "Sun") for d in
                 ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]]
-        w = WeeklyBarChart()
-        w.set_data(data)
-        w.repaint()  # No crash with max_val=0
+        chart.set_data(data)
+        force_paint(chart)  # No crash with max_val=0
 
-    def test_set_colors(self):
-        w = WeeklyBarChart()
-        w.set_colors("#FF0000", "#00FF00", "#000000",
-                      "#FFFFFF", "#888888", "#333333")
-        assert w._accent == "#FF0000"
+    def test_set_colors(self, chart):
+        chart.set_colors("#FF0000", "#00FF00", "#000000",
+                         "#FFFFFF", "#888888", "#333333")
+        assert chart._accent == "#FF0000"
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -338,60 +326,60 @@ class TestWeeklyBarChart:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
+@pytest.fixture(scope="class")
+def heatmap(qapp):
+    """One MonthlyHeatmap per test class; each test sets its own data."""
+    w = MonthlyHeatmap()
+    yield w
+    w.deleteLater()
+
+
 class TestMonthlyHeatmap:
-    def test_create(self):
-        w = MonthlyHeatmap()
-        assert w.hasMouseTracking()
+    def test_create(self, heatmap):
+        assert heatmap.hasMouseTracking()
 
-    def test_set_data_empty(self):
-        w = MonthlyHeatmap()
-        w.set_data([])
-        w.repaint()
+    def test_set_data_empty(self, heatmap):
+        heatmap.set_data([])
+        force_paint(heatmap)
 
-    def test_set_data_30_days(self):
+    def test_set_data_30_days(self, heatmap):
         today = date.today()
         data = [
             {"date": today - timedelta(days=29 - i),
              "sessions": i % 3, "minutes": i * 10, "xp": i * 40}
             for i in range(30)
         ]
-        w = MonthlyHeatmap()
-        w.set_data(data)
-        w.repaint()
-
-    def test_cell_at_returns_none_outside(self):
-        from PyQt6.QtCore import QPoint
-        w = MonthlyHeatmap()
-        w.set_data([{"date": date.today(), "sessions": 0, "minutes": 0, "xp": 0}])
-        result = w._cell_at(QPoint(999, 999))
+        heatmap.set_data(data)
+        force_paint(heatmap)
+
+    def test_cell_at_returns_none_outside(self, heatmap):
+        heatmap.set_data(
+            [{"date": date.today(), "sessions": 0, "minutes": 0, "xp": 0}]
+        )
+        result = heatmap._cell_at(QPoint(999, 999))
         assert result is None
 
-    def test_cell_at_returns_index_inside(self):
-        from PyQt6.QtCore import QPoint
+    def test_cell_at_returns_index_inside(self, heatmap):
         today = date.today()
         data = [
             {"date": today - timedelta(days=29 - i),
              "sessions": 1, "minutes": 30, "xp": 100}
             for i in range(30)
         ]
-        w = MonthlyHeatmap()
-        w.set_data(data)
+        heatmap.set_data(data)
         # Cell 0 is at approximately (2, 2) to (20, 20)
-        result = w._cell_at(QPoint(10, 10))
+        result = heatmap._cell_at(QPoint(10, 10))
         assert result == 0
 
-    def test_intensity_buckets(self):
-        w = MonthlyHeatmap()
-        assert w._intensity(0) == 0.0
-        assert w._intensity(15) == 0.3
-        assert w._intensity(45) == 0.6
-        assert w._intensity(90) == 1.0
+    def test_intensity_buckets(self, heatmap):
+        assert heatmap._intensity(0) == 0.0
+        assert heatmap._intensity(15) == 0.3
+        assert heatmap._intensity(45) == 0.6
+        assert heatmap._intensity(90) == 1.0
 
-    def test_set_colors(self):
-        w = MonthlyHeatmap()
-        w.set_colors("#FF0000", "#222222", "#888888")
-        assert w._accent == "#FF0000"
+    def test_set_colors(self, heatmap):
+        heatmap.set_colors("#FF0000", "#222222", "#888888")
+        assert heatmap._accent == "#FF0000"
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -399,28 +387,34 @@ class TestMonthlyHeatmap:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@pytest.mark.usefixtures("qapp")
+# The catalogue is fixed, so the roadmap inputs are worked out at import
+_TEASERS_LVL5 = REGISTRY.teasers(5, count=3)
+_NEXT_LVL5 = REGISTRY.next_upcoming(5)
+
+
+@pytest.fixture(scope="class")
+def roadmap(qapp):
+    """One _LevelRoadmap per test class; each test sets its own data."""
+    w = _LevelRoadmap()
+    yield w
+    w.deleteLater()
+
+
 class TestLevelRoadmap:
-    def test_create(self):
-        w = _LevelRoadmap()
-        assert w.minimumHeight() == 72
+    def test_create(self, roadmap):
+        assert roadmap.minimumHeight() == 72
 
-    def test_set_data_no_teasers(self):
-        w = _LevelRoadmap()
-        w.set_data(30, [], None)
-        w.repaint()  # Shows "all unlocked" message
+    def test_set_data_no_teasers(self, roadmap):
+        roadmap.set_data(30, [], None)
+        force_paint(roadmap)  # Shows "all unlocked" message
 
-    def test_set_data_with_teasers(self):
-        teasers = REGISTRY.teasers(5, count=3)
-        next_up = REGISTRY.next_upcoming(5)
-        w = _LevelRoadmap()
-        w.set_data(5, teasers, next_up)
-        w.repaint()
+    def test_set_data_with_teasers(self, roadmap):
+        roadmap.set_data(5, _TEASERS_LVL5, _NEXT_LVL5)
+        force_paint(roadmap)
 
-    def test_set_colors(self):
-        w = _LevelRoadmap()
-        w.set_colors("#AA00FF", "#0088FF", "#222222", "#FFFFFF", "#888888")
-        assert w._accent == "#AA00FF"
+    def test_set_colors(self, roadmap):
+        roadmap.set_colors("#AA00FF", "#0088FF", "#222222", "#FFFFFF", "#888888")
+        assert roadmap._accent == "#AA00FF"
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -451,25 +445,32 @@ class TestStatCard:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+def _built_widget(qapp) -> StatsWidget:
+    """A StatsWidget whose deferred first refresh has already run.
+
+    Lets the constructor's ``QTimer.singleShot(0, refresh)`` do the one
+    load, as in the app, instead of adding an explicit ``refresh()`` and
+    leaving the timer to fire in some later test.
+    """
+    w = StatsWidget()
+    qapp.processEvents()
+    return w
+
+
 @pytest.mark.usefixtures("qapp")
 class TestStatsWidget:
-    def test_create_and_refresh_empty_db(self):
-        w = StatsWidget()
-        w.refresh()  # deferred in __init__ via QTimer; call explicitly
+    def test_create_and_refresh_empty_db(self, qapp):
+        w = _built_widget(qapp)
         # Should not crash on empty DB
         assert w._cache is not None
 
-    def test_refresh_populates_level(self):
-        with get_session() as db:
-            progress = db.query(UserProgress).first()
-            progress.total_xp = 500
-            progress.current_level = 3
+    def test_refresh_populates_level(self, qapp):
+        set_progress(total_xp=500, current_level=3)
 
-        w = StatsWidget()
-        w.refresh()
+        w = _built_widget(qapp)
         assert "Level 3" in w._level_lbl.text()
 
-    def test_refresh_populates_today(self):
+    def test_refresh_populates_today(self, qapp):
         today = date.today()
         with get_session() as db:
             db.add(DailyStats(
@@ -479,12 +480,25 @@ class TestStatsWidget:
                 xp_earned=200,
             ))
 
-        w = StatsWidget()
-        w.refresh()
+        w = _built_widget(qapp)
         assert w._cache.today_sessions == 2
         assert "50" in w._today_minutes_lbl.text()
         assert "200" in w._today_xp_lbl.text()
 
+    def test_refresh_skips_reload_when_unchanged(self, qapp):
+        w = _built_widget(qapp)
+        first = w._cache
+        w.refresh()
+        assert w._cache is first
+
+    def test_refresh_reloads_after_db_change(self, qapp):
+        w = _built_widget(qapp)
+        first = w._cache
+        set_progress(total_xp=750)
+        w.refresh()
+        assert w._cache is not first
+        assert w._cache.total_xp == 750
+
     def test_apply_palette(self):
         w = StatsWidget()
         palette = {
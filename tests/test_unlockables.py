@@ -11,9 +11,9 @@ Covers:
 from __future__ import annotations
 
 import pytest
-from PyQt6.QtWidgets import QApplication
+from sqlalchemy import insert
 
-from focusquest.database.db import get_session
+from focusquest.database.db import _run_migrations, get_session
 from focusquest.database.models import Unlock, UserProgress
 from focusquest.gamification.unlockables import (
     REGISTRY, THEMES, COMPANIONS, TITLES,
@@ -22,6 +22,7 @@ from focusquest.gamification.unlockables import (
 )
 from focusquest.ui.styles import (
     get_palette, get_ring_colors, build_stylesheet, STATE_COLORS,
+    apply_global_stylesheet,
 )
 from focusquest.ui.companions import (
     create_companion, BaseCompanion,
@@ -31,12 +32,31 @@ from focusquest.ui.companions import (
 )
 from focusquest.timer.engine import TimerState
 
+from helpers import force_paint
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  REGISTRY TESTS
 # ═══════════════════════════════════════════════════════════════════════
 
 
+# Reference answers for every level, worked out once by brute force:
+# level-gated items in catalogue order, stably sorted by level.
+_SWEEP_LEVELS = range(0, 32)
+_LEVEL_GATED = sorted(
+    (i for i in REGISTRY.all_items() if i.unlock_type != "title"),
+    key=lambda i: i.required_level,
+)
+_EXPECTED_TEASERS = {
+    lvl: [i for i in _LEVEL_GATED if i.required_level > lvl][:3]
+    for lvl in _SWEEP_LEVELS
+}
+_EXPECTED_NEXT = {
+    lvl: (teasers[0] if teasers else None)
+    for lvl, teasers in _EXPECTED_TEASERS.items()
+}
+
+
 class TestRegistry:
     """Verify the global REGISTRY contains all expected items."""
 
@@ -71,20 +91,22 @@ class TestRegistry:
         assert REGISTRY.get("theme", "nonexistent") is None
         assert REGISTRY.get("companion", "nonexistent") is None
 
-    def test_next_upcoming_at_level_1(self):
-        item = REGISTRY.next_upcoming(1)
-        assert item is not None
-        # Should be the lowest-level item above 1 — Ocean at 3
-        assert item.required_level == 3
+    @pytest.mark.parametrize("level, expected_level", [
+        (1, 3),     # Ocean
+        (15, 16),   # Aurora
+        (30, None),  # all items unlocked
+    ])
+    def test_next_upcoming_at_level(self, level, expected_level):
+        item = REGISTRY.next_upcoming(level)
+        assert getattr(item, "required_level", None) == expected_level
 
-    def test_next_upcoming_at_level_30(self):
-        # All items unlocked
-        assert REGISTRY.next_upcoming(30) is None
+    @pytest.mark.parametrize("level", _SWEEP_LEVELS)
+    def test_next_upcoming_matches_reference(self, level):
+        assert REGISTRY.next_upcoming(level) is _EXPECTED_NEXT[level]
 
-    def test_next_upcoming_at_level_15(self):
-        item = REGISTRY.next_upcoming(15)
-        assert item is not None
-        assert item.required_level == 16  # Aurora
+    @pytest.mark.parametrize("level", _SWEEP_LEVELS)
+    def test_teasers_match_reference(self, level):
+        assert REGISTRY.teasers(level, count=3) == _EXPECTED_TEASERS[level]
 
     def test_teasers_returns_correct_count(self):
         teasers = REGISTRY.teasers(1, count=3)
@@ -105,27 +127,23 @@ class TestThemeCatalog:
     def test_theme_list_matches_count(self):
         assert len(THEMES) == 9
 
-    def test_all_themes_have_required_palette_keys(self):
+    @pytest.mark.parametrize("theme", THEMES, ids=lambda t: t.key)
+    def test_has_required_palette_keys(self, theme):
         required_keys = {
             "bg", "bg_secondary", "surface", "accent", "accent2",
             "text", "text_muted", "success", "warning", "danger", "border",
         }
-        for theme in THEMES:
-            missing = required_keys - set(theme.palette.keys())
-            assert not missing, f"{theme.key} missing palette keys: {missing}"
+        missing = required_keys - theme.palette.keys()
+        assert not missing, f"missing palette keys: {missing}"
 
-    def test_all_themes_have_working_ring_color(self):
-        for theme in THEMES:
-            assert "working" in theme.ring_colors, (
-                f"{theme.key} missing 'working' ring color"
-            )
+    @pytest.mark.parametrize("theme", THEMES, ids=lambda t: t.key)
+    def test_has_working_ring_color(self, theme):
+        assert "working" in theme.ring_colors
 
-    def test_all_themes_have_5_ring_states(self):
+    @pytest.mark.parametrize("theme", THEMES, ids=lambda t: t.key)
+    def test_has_5_ring_states(self, theme):
         expected = {"working", "short_break", "long_break", "paused", "idle"}
-        for theme in THEMES:
-            assert set(theme.ring_colors.keys()) == expected, (
-                f"{theme.key} has unexpected ring_colors keys"
-            )
+        assert theme.ring_colors.keys() == expected
 
     def test_theme_levels_are_ascending(self):
         levels = [t.required_level for t in THEMES]
@@ -206,32 +224,61 @@ class TestThemePalettes:
             qss = build_stylesheet(palette)
             assert len(qss) > 100  # non-trivial stylesheet
 
+    def test_build_stylesheet_reuses_qss_for_equal_palette(self, qapp):
+        palette = get_palette("forest")
+        assert build_stylesheet(dict(palette)) is build_stylesheet(palette)
+
+    def test_apply_global_stylesheet_sets_app_qss(self, qapp):
+        palette = get_palette("ocean")
+        previous = qapp.styleSheet()
+        try:
+            apply_global_stylesheet(palette)
+            assert qapp.styleSheet() == build_stylesheet(palette)
+        finally:
+            qapp.setStyleSheet(previous)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  UNLOCK MANAGER TESTS
 # ═══════════════════════════════════════════════════════════════════════
 
 
-class TestUnlockManager:
-    """Database‑backed unlock operations."""
+@pytest.fixture(scope="class")
+def first_unlocks(committed_db) -> list[dict]:
+    """The level-1 check's new unlocks, seeded once per test class."""
+    return UnlockManager().check_and_unlock(1, 0)
 
-    def test_check_and_unlock_seeds_defaults(self):
-        mgr = UnlockManager()
-        new = mgr.check_and_unlock(1, 0)
+
+@pytest.fixture
+def seeded_mgr(first_unlocks) -> UnlockManager:
+    """A manager over the class's seeded unlocks (it keeps no state)."""
+    return UnlockManager()
+
+
+class TestSeededUnlockManager:
+    """Read-only queries against the level-1 defaults."""
+
+    def test_check_and_unlock_seeds_defaults(self, first_unlocks):
         # Should seed midnight theme + sprout companion + first_steps title (1 session → 0 sessions, so no title)
-        keys = {(u["type"], u["key"]) for u in new}
+        keys = {(u["type"], u["key"]) for u in first_unlocks}
         assert ("theme", "midnight") in keys
         assert ("companion", "sprout") in keys
 
-    def test_get_equipped_theme_default(self):
-        mgr = UnlockManager()
-        mgr.check_and_unlock(1, 0)
-        assert mgr.get_equipped_theme() == "midnight"
+    def test_get_equipped_theme_default(self, seeded_mgr):
+        assert seeded_mgr.get_equipped_theme() == "midnight"
 
-    def test_get_equipped_companion_default(self):
-        mgr = UnlockManager()
-        mgr.check_and_unlock(1, 0)
-        assert mgr.get_equipped_companion() == "sprout"
+    def test_get_equipped_companion_default(self, seeded_mgr):
+        assert seeded_mgr.get_equipped_companion() == "sprout"
+
+    def test_is_unlocked_true(self, seeded_mgr):
+        assert seeded_mgr.is_unlocked("theme", "midnight") is True
+
+    def test_is_unlocked_false(self, seeded_mgr):
+        assert seeded_mgr.is_unlocked("theme", "neon") is False
+
+
+class TestUnlockManager:
+    """Database‑backed unlock operations."""
 
     def test_level_5_unlocks_ocean_forest_ember(self):
         mgr = UnlockManager()
@@ -254,16 +301,6 @@ class TestUnlockManager:
         mgr.equip("companion", "ember")
         assert mgr.get_equipped_companion() == "ember"
 
-    def test_is_unlocked_true(self):
-        mgr = UnlockManager()
-        mgr.check_and_unlock(1, 0)
-        assert mgr.is_unlocked("theme", "midnight") is True
-
-    def test_is_unlocked_false(self):
-        mgr = UnlockManager()
-        mgr.check_and_unlock(1, 0)
-        assert mgr.is_unlocked("theme", "neon") is False
-
     def test_get_all_unlocked(self):
         mgr = UnlockManager()
         mgr.check_and_unlock(5, 2)
@@ -293,6 +330,18 @@ class TestUnlockManager:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+# The catalogue is the one source of truth for which companions exist
+_COMPANION_KEYS = [c.key for c in COMPANIONS]
+
+
+@pytest.fixture(scope="class", params=_COMPANION_KEYS)
+def comp(request, qapp):
+    """One widget per companion key, shared by that key's paint tests."""
+    w = create_companion(request.param)
+    yield w
+    w.deleteLater()
+
+
 @pytest.mark.usefixtures("qapp")
 class TestCompanionWidgets:
     """Test companion creation and basic lifecycle."""
@@ -301,12 +350,12 @@ class TestCompanionWidgets:
         w = create_companion("sprout")
         assert isinstance(w, SproutCompanion)
 
-    def test_create_all_keys(self):
-        for key in ["sprout", "ember", "ripple", "pixel", "nova", "zen"]:
-            w = create_companion(key)
-            assert isinstance(w, BaseCompanion)
-            assert w.width() == BaseCompanion.WIDGET_WIDTH
-            assert w.height() == BaseCompanion.WIDGET_HEIGHT
+    @pytest.mark.parametrize("key", _COMPANION_KEYS)
+    def test_create(self, key):
+        w = create_companion(key)
+        assert isinstance(w, BaseCompanion)
+        assert w.width() == BaseCompanion.WIDGET_WIDTH
+        assert w.height() == BaseCompanion.WIDGET_HEIGHT
 
     def test_unknown_key_defaults_to_sprout(self):
         w = create_companion("nonexistent")
@@ -346,20 +395,20 @@ class TestCompanionWidgets:
         w.set_session_progress(-0.5)
         assert w._session_progress == 0.0
 
-    def test_companion_widget_map_complete(self):
-        """Every CompanionDef.widget_class has a matching entry."""
-        for comp in COMPANIONS:
-            assert comp.key in COMPANION_WIDGETS, (
-                f"Companion {comp.key} not in COMPANION_WIDGETS"
-            )
+    @pytest.mark.parametrize("key", _COMPANION_KEYS)
+    def test_companion_in_widget_map(self, key):
+        """Every CompanionDef has a matching widget class."""
+        assert key in COMPANION_WIDGETS
 
-    def test_paint_no_crash(self):
-        """Call repaint on each companion in each state — no exceptions."""
-        for key in COMPANION_WIDGETS:
-            w = create_companion(key)
-            for state in ["idle", "focus", "celebrate", "sleep"]:
-                w.set_state(state) if state != "celebrate" else w.trigger_celebrate()
-                w.repaint()  # Should not crash
+    @pytest.mark.parametrize("state", ["idle", "focus", "sleep"])
+    def test_paint_no_crash(self, comp, state):
+        """Repaint each companion in each state — no exceptions."""
+        comp.set_state(state)
+        force_paint(comp)
+
+    def test_paint_celebrate_no_crash(self, comp):
+        comp.trigger_celebrate()
+        force_paint(comp)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -367,41 +416,33 @@ class TestCompanionWidgets:
 # ═══════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def migrated_db(committed_db):
+    """Both legacy unlock rows, inserted and migrated once per class."""
+    with committed_db.connect() as conn:
+        conn.execute(insert(Unlock), [
+            {"unlock_type": "character", "unlock_key": "apprentice",
+             "is_equipped": True},
+            {"unlock_type": "theme", "unlock_key": "default",
+             "is_equipped": True},
+        ])
+        _run_migrations(conn)
+        conn.commit()
+
+
+@pytest.mark.usefixtures("migrated_db")
 class TestMigrations:
     """Test that old‑format DB rows are renamed correctly."""
 
     def test_old_character_type_migrated(self):
-        """Insert an old 'character' row and verify it becomes 'companion'."""
-        with get_session() as db:
-            db.add(Unlock(
-                unlock_type="character",
-                unlock_key="apprentice",
-                is_equipped=True,
-            ))
-            db.commit()
-
-        # Run migrations
-        from focusquest.database.db import _get_engine, _run_migrations
-        _run_migrations(_get_engine())
-
+        """An old 'character' row becomes a 'companion'."""
         with get_session() as db:
             row = db.query(Unlock).filter_by(unlock_key="sprout").first()
             assert row is not None
             assert row.unlock_type == "companion"
 
     def test_old_theme_key_migrated(self):
-        """Insert an old 'default' theme and verify it becomes 'midnight'."""
-        with get_session() as db:
-            db.add(Unlock(
-                unlock_type="theme",
-                unlock_key="default",
-                is_equipped=True,
-            ))
-            db.commit()
-
-        from focusquest.database.db import _get_engine, _run_migrations
-        _run_migrations(_get_engine())
-
+        """An old 'default' theme becomes 'midnight'."""
         with get_session() as db:
             row = db.query(Unlock).filter_by(
                 unlock_type="theme", unlock_key="midnight",
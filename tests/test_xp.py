@@ -5,49 +5,67 @@ leveling curve, level titles, idempotency guard, persistence,
 break sessions, signal emissions, and integration with the timer engine.
 """
 
+import numpy as np
 import pytest
 from datetime import date, timedelta
 
 from focusquest.database.db import get_session
 from focusquest.database.models import (
-    UserProgress, DailyStats, Session as PomSession,
+    USER_PROGRESS_ID, UserProgress, DailyStats, Session as PomSession,
 )
 from focusquest.gamification.xp import (
-    XPEngine,
     xp_for_level,
     level_for_xp,
     xp_to_next_level,
     xp_in_current_level,
     title_for_level,
     _xp_delta,
-    BASE_XP_PER_LEVEL,
     LEVEL_SCALING,
 )
-from focusquest.timer.engine import TimerEngine, TimerState, SessionType
+from focusquest.timer.engine import TimerEngine
 
-from helpers import SignalCollector, complete_session
+from helpers import SignalCollector, complete_session, set_progress
 
 
 # ── helpers ──────────────────────────────────────────────────────────────
 
-def _make_xp_engine(qapp):
-    return XPEngine(parent=None)
+@pytest.fixture
+def pom_session_id(frozen_now) -> int:
+    """ID of a freshly stored, completed 25-minute work session."""
+    with get_session() as db:
+        pom = PomSession(
+            start_time=frozen_now,
+            end_time=frozen_now,
+            duration_seconds=1500,
+            session_type="work",
+            completed=True,
+        )
+        db.add(pom)
+        db.flush()
+        return pom.id
+
+
+def _bonus_amounts(result: dict) -> dict[str, int]:
+    """An award result's bonuses as a name → amount mapping."""
+    return {b["name"]: b["amount"] for b in result["bonuses"]}
+
+
+# Everything but the date, which has to be read per call
+_AWARD_WORK_DEFAULTS = dict(
+    session_type="work",
+    duration_minutes=25,
+    task_label="",
+    round_number=1,
+    rounds_per_cycle=4,
+    was_micro=False,
+    db_session_id=None,
+)
 
 
 def _award_work(xp_engine, **kwargs):
     """Award a standard work session with sensible defaults."""
-    defaults = dict(
-        session_type="work",
-        duration_minutes=25,
-        task_label="",
-        round_number=1,
-        rounds_per_cycle=4,
-        was_micro=False,
-        session_date=date.today(),
-        db_session_id=None,
-    )
-    defaults.update(kwargs)
-    return xp_engine.award_session(**defaults)
+    kwargs.setdefault("session_date", date.today())
+    return xp_engine.award_session(**{**_AWARD_WORK_DEFAULTS, **kwargs})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -55,14 +73,17 @@ def _award_work(xp_engine, **kwargs):
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.no_db
 class TestLevelingCurve:
 
-    def test_xp_for_level_1_is_zero(self):
-        assert xp_for_level(1) == 0
-
-    def test_xp_for_level_2(self):
-        """Level 1→2 costs 200 XP."""
-        assert xp_for_level(2) == 200
+    @pytest.mark.parametrize("level, expected", [
+        (1, 0),
+        (2, 200),  # level 1→2 costs 200 XP
+        (3, _xp_delta(1) + _xp_delta(2)),
+        (5, sum(_xp_delta(l) for l in range(1, 5))),
+    ])
+    def test_xp_for_level(self, level, expected):
+        assert xp_for_level(level) == expected
 
     def test_xp_delta_level_1(self):
         assert _xp_delta(1) == 200
@@ -73,26 +94,16 @@ class TestLevelingCurve:
 
     def test_xp_delta_increases_each_level(self):
         """Each level delta should be strictly more than the last."""
-        for lvl in range(1, 50):
-            assert _xp_delta(lvl + 1) > _xp_delta(lvl)
-
-    def test_xp_for_level_3(self):
-        expected = _xp_delta(1) + _xp_delta(2)
-        assert xp_for_level(3) == expected
-
-    def test_xp_for_level_5(self):
-        expected = sum(_xp_delta(l) for l in range(1, 5))
-        assert xp_for_level(5) == expected
+        deltas = np.fromiter((_xp_delta(l) for l in range(1, 51)), dtype=np.int64)
+        assert (np.diff(deltas) > 0).all()
 
-    def test_level_for_xp_zero(self):
-        assert level_for_xp(0) == 1
-
-    def test_level_for_xp_at_boundary(self):
-        """Exactly enough XP to reach level 2."""
-        assert level_for_xp(200) == 2
-
-    def test_level_for_xp_just_below_boundary(self):
-        assert level_for_xp(199) == 1
+    @pytest.mark.parametrize("total_xp, expected", [
+        (0, 1),
+        (200, 2),  # exactly enough XP to reach level 2
+        (199, 1),  # just below the boundary
+    ])
+    def test_level_for_xp(self, total_xp, expected):
+        assert level_for_xp(total_xp) == expected
 
     def test_level_for_xp_high(self):
         """Large XP should produce a high level."""
@@ -102,27 +113,25 @@ class TestLevelingCurve:
         assert xp_to_next_level(0) == 200  # need 200 to reach level 2
         assert xp_to_next_level(100) == 100
 
-    def test_xp_in_current_level(self):
-        earned, needed = xp_in_current_level(0)
-        assert earned == 0
-        assert needed == 200
-
-    def test_xp_in_current_level_mid(self):
-        earned, needed = xp_in_current_level(100)
-        assert earned == 100
-        assert needed == 200
+    @pytest.mark.parametrize("total_xp, expected", [
+        (0, (0, 200)),
+        (100, (100, 200)),
+        (200, (0, _xp_delta(2))),  # first XP of level 2
+    ])
+    def test_xp_in_current_level(self, total_xp, expected):
+        assert xp_in_current_level(total_xp) == expected
 
-    def test_xp_in_current_level_at_level_2(self):
-        earned, needed = xp_in_current_level(200)
-        assert earned == 0
-        assert needed == _xp_delta(2)
-
-    def test_roundtrip_level(self):
+    @pytest.mark.parametrize("total_xp", [0, 100, 200, 500, 1000, 5000, 50000])
+    def test_roundtrip_level(self, total_xp):
         """Computing level from XP and back should be consistent."""
-        for total_xp in [0, 100, 200, 500, 1000, 5000, 50000]:
-            level = level_for_xp(total_xp)
-            assert xp_for_level(level) <= total_xp
-            assert xp_for_level(level + 1) > total_xp
+        level = level_for_xp(total_xp)
+        assert xp_for_level(level) <= total_xp
+        assert xp_for_level(level + 1) > total_xp
+
+    @pytest.mark.parametrize("level", [99, 100, 101, 120])
+    def test_level_thresholds_past_precomputed_table(self, level):
+        assert level_for_xp(xp_for_level(level)) == level
+        assert level_for_xp(xp_for_level(level) - 1) == level - 1
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -130,6 +139,7 @@ class TestLevelingCurve:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@pytest.mark.no_db
 class TestLevelTitles:
 
     def test_level_1_title(self):
@@ -167,37 +177,18 @@ class TestLevelTitles:
 
 class TestBaseXPByDuration:
 
-    def test_25_min_session(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=25)
-        # First session → base + daily kickoff (streak is 0)
-        assert result["xp_earned"] == 100 + 50
-
-    def test_15_min_session(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=15)
-        assert result["xp_earned"] == 65 + 50
-
-    def test_10_min_session(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=10)
-        assert result["xp_earned"] == 40 + 50
-
-    def test_12_min_session_gives_10_min_rate(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=12)
-        assert result["xp_earned"] == 40 + 50
-
-    def test_30_min_extended_gives_25_rate(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=30)
-        assert result["xp_earned"] == 100 + 50
-
-    def test_5_min_session_gives_10_min_rate(self, qapp):
-        """Even tiny durations get the lowest bucket."""
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=5)
-        assert result["xp_earned"] == 40 + 50
+    # First session of the day → base + daily kickoff (streak is 0)
+    @pytest.mark.parametrize("duration, expected", [
+        (25, 100 + 50),
+        (15, 65 + 50),
+        (10, 40 + 50),
+        (12, 40 + 50),   # rounds down to the 10-min rate
+        (30, 100 + 50),  # extended sessions cap at the 25-min rate
+        (5, 40 + 50),    # even tiny durations get the lowest bucket
+    ])
+    def test_duration_xp(self, xp_engine, duration, expected):
+        result = _award_work(xp_engine, duration_minutes=duration)
+        assert result["xp_earned"] == expected
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -207,38 +198,24 @@ class TestBaseXPByDuration:
 
 class TestStreakBonus:
 
-    def test_zero_streak_no_bonus(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert "Streak" not in " ".join(bonuses.keys())
+    def test_zero_streak_no_bonus(self, xp_engine):
+        result = _award_work(xp_engine)
+        assert "Streak" not in " ".join(_bonus_amounts(result))
 
-    def test_5_day_streak_bonus(self, qapp):
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.current_streak_days = 5
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Streak x5"] == 50
-
-    def test_streak_cap_at_100(self, qapp):
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.current_streak_days = 20
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Streak x20"] == 100  # capped
-
-    def test_streak_cap_at_exactly_10(self, qapp):
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.current_streak_days = 10
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Streak x10"] == 100
+    def test_5_day_streak_bonus(self, xp_engine):
+        set_progress(current_streak_days=5)
+        result = _award_work(xp_engine)
+        assert _bonus_amounts(result)["Streak x5"] == 50
+
+    def test_streak_cap_at_100(self, xp_engine):
+        set_progress(current_streak_days=20)
+        result = _award_work(xp_engine)
+        assert _bonus_amounts(result)["Streak x20"] == 100  # capped
+
+    def test_streak_cap_at_exactly_10(self, xp_engine):
+        set_progress(current_streak_days=10)
+        result = _award_work(xp_engine)
+        assert _bonus_amounts(result)["Streak x10"] == 100
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -248,30 +225,24 @@ class TestStreakBonus:
 
 class TestDailyKickoff:
 
-    def test_first_session_gets_kickoff(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Daily Kickoff"] == 50
+    def test_first_session_gets_kickoff(self, xp_engine):
+        result = _award_work(xp_engine)
+        assert _bonus_amounts(result)["Daily Kickoff"] == 50
 
-    def test_second_session_no_kickoff(self, qapp):
-        xp = _make_xp_engine(qapp)
-        _award_work(xp)  # first
+    def test_second_session_no_kickoff(self, xp_engine):
+        _award_work(xp_engine)  # first
 
-        result = _award_work(xp)  # second
-        bonus_names = [b["name"] for b in result["bonuses"]]
-        assert "Daily Kickoff" not in bonus_names
+        result = _award_work(xp_engine)  # second
+        assert "Daily Kickoff" not in _bonus_amounts(result)
 
-    def test_kickoff_resets_next_day(self, qapp):
-        xp = _make_xp_engine(qapp)
+    def test_kickoff_resets_next_day(self, xp_engine):
         today = date.today()
         tomorrow = today + timedelta(days=1)
 
-        _award_work(xp, session_date=today)  # first today
+        _award_work(xp_engine, session_date=today)  # first today
 
-        result = _award_work(xp, session_date=tomorrow)  # first tomorrow
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Daily Kickoff"] == 50
+        result = _award_work(xp_engine, session_date=tomorrow)  # first tomorrow
+        assert _bonus_amounts(result)["Daily Kickoff"] == 50
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -281,23 +252,14 @@ class TestDailyKickoff:
 
 class TestCycleBonus:
 
-    def test_round_4_gets_cycle_bonus(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, round_number=4, rounds_per_cycle=4)
-        bonuses = {b["name"]: b["amount"] for b in result["bonuses"]}
-        assert bonuses["Full Cycle!"] == 150
-
-    def test_round_3_no_cycle_bonus(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, round_number=3, rounds_per_cycle=4)
-        bonus_names = [b["name"] for b in result["bonuses"]]
-        assert "Full Cycle!" not in bonus_names
+    def test_round_4_gets_cycle_bonus(self, xp_engine):
+        result = _award_work(xp_engine, round_number=4, rounds_per_cycle=4)
+        assert _bonus_amounts(result)["Full Cycle!"] == 150
 
-    def test_round_1_no_cycle_bonus(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, round_number=1)
-        bonus_names = [b["name"] for b in result["bonuses"]]
-        assert "Full Cycle!" not in bonus_names
+    @pytest.mark.parametrize("round_number", [1, 3])
+    def test_mid_cycle_round_no_cycle_bonus(self, xp_engine, round_number):
+        result = _award_work(xp_engine, round_number=round_number)
+        assert "Full Cycle!" not in _bonus_amounts(result)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -307,22 +269,22 @@ class TestCycleBonus:
 
 class TestCombinedXP:
 
-    def test_all_bonuses_stack(self, qapp):
+    def test_all_bonuses_stack(self, xp_engine):
         """25-min + 5-day streak + daily kickoff + cycle bonus."""
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.current_streak_days = 5
+        set_progress(current_streak_days=5)
 
-        xp = _make_xp_engine(qapp)
         result = _award_work(
-            xp, duration_minutes=25, round_number=4,
+            xp_engine, duration_minutes=25, round_number=4,
         )
         # 100 (base) + 50 (streak x5) + 50 (kickoff) + 150 (cycle)
         assert result["xp_earned"] == 350
+        assert _bonus_amounts(result) == {
+            "Session": 100, "Streak x5": 50,
+            "Daily Kickoff": 50, "Full Cycle!": 150,
+        }
 
-    def test_micro_10_with_kickoff(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=10)
+    def test_micro_10_with_kickoff(self, xp_engine):
+        result = _award_work(xp_engine, duration_minutes=10)
         # 40 (base) + 50 (kickoff)
         assert result["xp_earned"] == 90
 
@@ -334,14 +296,14 @@ class TestCombinedXP:
 
 class TestBreakSessions:
 
-    def test_short_break_earns_zero(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = xp.award_session(session_type="short_break", duration_minutes=5)
-        assert result["xp_earned"] == 0
-
-    def test_long_break_earns_zero(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = xp.award_session(session_type="long_break", duration_minutes=15)
+    @pytest.mark.parametrize("session_type, duration", [
+        ("short_break", 5),
+        ("long_break", 15),
+    ])
+    def test_break_earns_zero(self, xp_engine, session_type, duration):
+        result = xp_engine.award_session(
+            session_type=session_type, duration_minutes=duration,
+        )
         assert result["xp_earned"] == 0
 
 
@@ -352,34 +314,22 @@ class TestBreakSessions:
 
 class TestIdempotency:
 
-    def test_double_award_with_session_id(self, qapp):
+    def test_double_award_with_session_id(self, xp_engine, pom_session_id):
         """Calling award_session twice with the same DB ID doesn't double-count."""
-        # Create a completed session record
-        from datetime import datetime
-        with get_session() as db:
-            pom = PomSession(
-                start_time=datetime.now(),
-                end_time=datetime.now(),
-                duration_seconds=1500,
-                session_type="work",
-                completed=True,
-            )
-            db.add(pom)
-            db.flush()
-            session_id = pom.id
-
-        xp = _make_xp_engine(qapp)
-        r1 = _award_work(xp, db_session_id=session_id)
-        r2 = _award_work(xp, db_session_id=session_id)
+        r1 = _award_work(xp_engine, db_session_id=pom_session_id)
+        r2 = _award_work(xp_engine, db_session_id=pom_session_id)
 
         assert r1["xp_earned"] > 0
         assert r2["xp_earned"] == 0  # idempotent — no double-count
 
-    def test_without_session_id_no_guard(self, qapp):
+    def test_unknown_session_id_still_awards(self, xp_engine):
+        """An ID with no session row is not treated as already awarded."""
+        assert _award_work(xp_engine, db_session_id=9999)["xp_earned"] > 0
+
+    def test_without_session_id_no_guard(self, xp_engine):
         """Without a DB session ID, each call awards XP independently."""
-        xp = _make_xp_engine(qapp)
-        r1 = _award_work(xp)
-        r2 = _award_work(xp)
+        r1 = _award_work(xp_engine)
+        r2 = _award_work(xp_engine)
         assert r1["xp_earned"] > 0
         assert r2["xp_earned"] > 0
 
@@ -391,19 +341,17 @@ class TestIdempotency:
 
 class TestPersistence:
 
-    def test_user_progress_updated(self, qapp):
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp, duration_minutes=25)
+    def test_user_progress_updated(self, xp_engine):
+        result = _award_work(xp_engine, duration_minutes=25)
 
         with get_session() as db:
-            p = db.query(UserProgress).first()
+            p = db.get(UserProgress, USER_PROGRESS_ID)
             assert p.total_xp == result["xp_earned"]
             assert p.total_sessions_completed == 1
             assert p.total_focus_minutes == 25
 
-    def test_daily_stats_created(self, qapp):
-        xp = _make_xp_engine(qapp)
-        _award_work(xp, session_date=date.today())
+    def test_daily_stats_created(self, xp_engine):
+        _award_work(xp_engine, session_date=date.today())
 
         with get_session() as db:
             daily = db.query(DailyStats).filter_by(date=date.today()).first()
@@ -412,50 +360,38 @@ class TestPersistence:
             assert daily.focus_minutes == 25
             assert daily.xp_earned > 0
 
-    def test_daily_stats_accumulates(self, qapp):
-        xp = _make_xp_engine(qapp)
-        _award_work(xp, session_date=date.today())
-        _award_work(xp, session_date=date.today())
+    def test_daily_stats_accumulates(self, xp_engine):
+        today = date.today()
+        first = _award_work(xp_engine, session_date=today)
+        second = _award_work(xp_engine, session_date=today)
 
+        # Only the first one is the day's kickoff
+        assert first["xp_earned"] == 150
+        assert second["xp_earned"] == 100
         with get_session() as db:
-            daily = db.query(DailyStats).filter_by(date=date.today()).first()
+            daily = db.query(DailyStats).filter_by(date=today).first()
             assert daily.sessions_completed == 2
+            assert daily.xp_earned == 250
 
-    def test_task_label_increments_tasks_completed(self, qapp):
-        xp = _make_xp_engine(qapp)
-        _award_work(xp, task_label="My Task")
+    def test_task_label_increments_tasks_completed(self, xp_engine):
+        _award_work(xp_engine, task_label="My Task")
 
         with get_session() as db:
             daily = db.query(DailyStats).filter_by(date=date.today()).first()
             assert daily.tasks_completed == 1
 
-    def test_no_task_label_doesnt_increment(self, qapp):
-        xp = _make_xp_engine(qapp)
-        _award_work(xp, task_label="")
+    def test_no_task_label_doesnt_increment(self, xp_engine):
+        _award_work(xp_engine, task_label="")
 
         with get_session() as db:
             daily = db.query(DailyStats).filter_by(date=date.today()).first()
             assert daily.tasks_completed == 0
 
-    def test_xp_awarded_flag_set_on_session(self, qapp):
-        from datetime import datetime
-        with get_session() as db:
-            pom = PomSession(
-                start_time=datetime.now(),
-                end_time=datetime.now(),
-                duration_seconds=1500,
-                session_type="work",
-                completed=True,
-            )
-            db.add(pom)
-            db.flush()
-            session_id = pom.id
-
-        xp = _make_xp_engine(qapp)
-        _award_work(xp, db_session_id=session_id)
+    def test_xp_awarded_flag_set_on_session(self, xp_engine, pom_session_id):
+        _award_work(xp_engine, db_session_id=pom_session_id)
 
         with get_session() as db:
-            pom = db.get(PomSession, session_id)
+            pom = db.get(PomSession, pom_session_id)
             assert pom.xp_awarded is True
 
 
@@ -466,35 +402,28 @@ class TestPersistence:
 
 class TestLevelUp:
 
-    def test_level_up_detected(self, qapp):
+    def test_level_up_detected(self, xp_engine):
         """Give enough XP to cross the level 1→2 boundary."""
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.total_xp = 190  # need 200 to hit level 2
+        set_progress(total_xp=190)  # need 200 to hit level 2
 
-        xp = _make_xp_engine(qapp)
         # 25-min = 100 base. No streak. But kickoff still applies?
         # Actually, streak is 0, kickoff = 50. So 150 total.
         # 190 + 150 = 340, which > 200 → level up
-        result = _award_work(xp)
+        result = _award_work(xp_engine)
         assert result["level_up"] is True
         assert result["new_level"] == 2
         assert result["old_level"] == 1
 
-    def test_no_level_up_when_not_enough(self, qapp):
-        xp = _make_xp_engine(qapp)
+    def test_no_level_up_when_not_enough(self, xp_engine):
         # Start at 0. First session = 100+50=150. Need 200 for level 2.
-        result = _award_work(xp)
+        result = _award_work(xp_engine)
         assert result["level_up"] is False
         assert result["new_level"] == 1
 
-    def test_level_up_returns_title(self, qapp):
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.total_xp = 190
+    def test_level_up_returns_title(self, xp_engine):
+        set_progress(total_xp=190)
 
-        xp = _make_xp_engine(qapp)
-        result = _award_work(xp)
+        result = _award_work(xp_engine)
         assert result["new_title"] == "Focus Apprentice"  # still 1-4 range
 
 
@@ -505,12 +434,9 @@ class TestLevelUp:
 
 class TestSignals:
 
-    def test_xp_awarded_signal_emitted(self, qapp):
-        xp = _make_xp_engine(qapp)
-        c = SignalCollector()
-        xp.xp_awarded.connect(c)
-
-        _award_work(xp)
+    def test_xp_awarded_signal_emitted(self, xp_engine):
+        with SignalCollector(xp_engine.xp_awarded) as c:
+            _award_work(xp_engine)
 
         assert len(c) == 1
         data = c.last
@@ -518,24 +444,18 @@ class TestSignals:
         assert "bonuses" in data
         assert isinstance(data["bonuses"], list)
 
-    def test_xp_awarded_signal_not_emitted_for_breaks(self, qapp):
-        xp = _make_xp_engine(qapp)
-        c = SignalCollector()
-        xp.xp_awarded.connect(c)
-
-        xp.award_session(session_type="short_break", duration_minutes=5)
+    def test_xp_awarded_signal_not_emitted_for_breaks(self, xp_engine):
+        with SignalCollector(xp_engine.xp_awarded) as c:
+            xp_engine.award_session(
+                session_type="short_break", duration_minutes=5,
+            )
         assert len(c) == 0
 
-    def test_level_up_signal_emitted(self, qapp):
-        with get_session() as db:
-            p = db.query(UserProgress).first()
-            p.total_xp = 190
-
-        xp = _make_xp_engine(qapp)
-        c = SignalCollector()
-        xp.level_up.connect(c)
+    def test_level_up_signal_emitted(self, xp_engine):
+        set_progress(total_xp=190)
 
-        _award_work(xp)
+        with SignalCollector(xp_engine.level_up) as c:
+            _award_work(xp_engine)
 
         assert len(c) == 1
         data = c.last
@@ -543,20 +463,14 @@ class TestSignals:
         assert data["old_level"] == 1
         assert "new_title" in data
 
-    def test_level_up_signal_not_emitted_without_level_change(self, qapp):
-        xp = _make_xp_engine(qapp)
-        c = SignalCollector()
-        xp.level_up.connect(c)
-
-        _award_work(xp)  # 150 XP, need 200 to level up
+    def test_level_up_signal_not_emitted_without_level_change(self, xp_engine):
+        with SignalCollector(xp_engine.level_up) as c:
+            _award_work(xp_engine)  # 150 XP, need 200 to level up
         assert len(c) == 0
 
-    def test_xp_awarded_data_includes_total_and_level(self, qapp):
-        xp = _make_xp_engine(qapp)
-        c = SignalCollector()
-        xp.xp_awarded.connect(c)
-
-        _award_work(xp)
+    def test_xp_awarded_data_includes_total_and_level(self, xp_engine):
+        with SignalCollector(xp_engine.xp_awarded) as c:
+            _award_work(xp_engine)
         data = c.last
         assert "total_xp" in data
         assert "level" in data
@@ -570,33 +484,34 @@ class TestSignals:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestEngineIntegration:
-    """Verify the session_completed signal carries all fields the XP
-    engine needs, and that an end-to-end flow works."""
-
-    def test_session_completed_has_db_session_id(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+@pytest.fixture(scope="class")
+def completed_work_signal(qapp, committed_db) -> dict:
+    """``session_completed`` payload of one finished work session.
 
+    Recorded once per class for the tests that only read it.
+    """
+    engine = TimerEngine(parent=None, db_enabled=True, auto_advance=False)
+    with SignalCollector(engine.session_completed) as c:
         engine.start()
         complete_session(engine)
+    return c.last
 
-        data = c.last
-        assert "db_session_id" in data
-        assert data["db_session_id"] is not None
 
-    def test_session_completed_has_rounds_per_cycle(self, engine):
-        c = SignalCollector()
-        engine.session_completed.connect(c)
+class TestEngineIntegration:
+    """Verify the session_completed signal carries all fields the XP
+    engine needs, and that an end-to-end flow works."""
 
-        engine.start()
-        complete_session(engine)
+    def test_session_completed_has_db_session_id(self, completed_work_signal):
+        data = completed_work_signal
+        assert "db_session_id" in data
+        assert data["db_session_id"] is not None
 
-        data = c.last
+    def test_session_completed_has_rounds_per_cycle(self, completed_work_signal):
+        data = completed_work_signal
         assert "rounds_per_cycle" in data
         assert data["rounds_per_cycle"] == 4
 
-    def test_end_to_end_xp_award(self, engine):
+    def test_end_to_end_xp_award(self, engine, xp_engine):
         """Complete a work session → feed data to XPEngine → verify."""
         c = SignalCollector()
         engine.session_completed.connect(c)
@@ -605,8 +520,7 @@ class TestEngineIntegration:
         complete_session(engine)
 
         data = c.last
-        xp = XPEngine(parent=None)
-        result = xp.award_session(
+        result = xp_engine.award_session(
             session_type=data["session_type"],
             duration_minutes=data["duration_seconds"] // 60,
             task_label=data.get("task_label", "") or "",
@@ -619,7 +533,7 @@ class TestEngineIntegration:
         assert result["xp_earned"] > 0
 
         # Verify idempotency — second call returns 0
-        result2 = xp.award_session(
+        result2 = xp_engine.award_session(
             session_type=data["session_type"],
             duration_minutes=data["duration_seconds"] // 60,
             session_date=data["end_time"].date(),
@@ -627,7 +541,7 @@ class TestEngineIntegration:
         )
         assert result2["xp_earned"] == 0
 
-    def test_break_session_no_xp(self, engine):
+    def test_break_session_no_xp(self, engine, xp_engine):
         """Complete work then break — break should give 0 XP."""
         engine.start()
         complete_session(engine)  # work done
@@ -638,8 +552,7 @@ class TestEngineIntegration:
         complete_session(engine)
 
         data = c.last
-        xp = XPEngine(parent=None)
-        result = xp.award_session(
+        result = xp_engine.award_session(
             session_type=data["session_type"],
             duration_minutes=data["duration_seconds"] // 60,
         )